@@ -2,6 +2,21 @@ document.addEventListener('DOMContentLoaded', () => {
     const table = document.getElementById('job-table');
     const tbody = table.querySelector('tbody');
     const rows = Array.from(tbody.querySelectorAll('tr.job-row'));
+    // Per-row filter fields, read from the DOM once; the cells never change after load
+    const rowFields = rows.map(row => {
+        const company = row.children[1].textContent.trim();
+        return {
+            row,
+            roleLower: row.children[0].querySelector('.summary-content').textContent.toLowerCase(),
+            company,
+            companyLower: company.toLowerCase(),
+            category: row.children[2].textContent,
+            status: row.children[4].textContent,
+            // Unix seconds emitted by the generator; NaN for undated rows
+            postedTime: Number(row.dataset.postedTs)
+        };
+    });
+    const rowPostedTime = new Map(rowFields.map(fields => [fields.row, fields.postedTime]));
     const searchInput = document.getElementById('search-input');
     const categoryFilter = document.getElementById('category-filter');
     const statusFilter = document.getElementById('status-filter');
@@ -15,7 +30,8 @@ document.addEventListener('DOMContentLoaded', () => {
     const prevButton = document.getElementById('prev-page');
     const nextButton = document.getElementById('next-page');
 
-    let sortDirection = 'desc';
+    // Rows arrive sorted newest first (server-side), so the first click sorts ascending
+    let sortDirection = 'asc';
     let lastCategoryKey = null; // track last category to guard resets
     let currentSkills = []; // skills computed from currently visible rows
     let currentSkillsTotalJobs = 0; // denominator for percentages
@@ -73,9 +89,28 @@ document.addEventListener('DOMContentLoaded', () => {
         return out;
     }
 
+    // Parsed qualification lists per row element (filled lazily)
+    const rowSkillLists = new WeakMap();
+
     // Compute skills from the qualifications in the details of visible rows
     function computeSkillsFromVisibleRows(visibleRows) {
-        const map = new Map(); // name -> { basic_count, preferred_count }
+        // Counts kept as parallel arrays indexed by first appearance; the
+        // per-skill count objects are only built for the returned list
+        const slot = new Map(); // name -> index into names/basicCounts/prefCounts
+        const names = [];
+        const basicCounts = [];
+        const prefCounts = [];
+        const slotFor = name => {
+            let i = slot.get(name);
+            if (i === undefined) {
+                i = names.length;
+                slot.set(name, i);
+                names.push(name);
+                basicCounts.push(0);
+                prefCounts.push(0);
+            }
+            return i;
+        };
         const getNextPHtml = (detailsEl, heading) => {
             const h4s = detailsEl.querySelectorAll('h4');
             for (const h4 of h4s) {
@@ -88,28 +123,32 @@ document.addEventListener('DOMContentLoaded', () => {
         };
 
         visibleRows.forEach(row => {
-            const details = row.querySelector('.details-container');
-            if (!details) return;
-            const basicHtml = getNextPHtml(details, 'basic qualifications');
-            const prefHtml = getNextPHtml(details, 'preferred qualifications');
-            const basicList = splitHtmlBullets(basicHtml);
-            const prefList = splitHtmlBullets(prefHtml);
-
-            basicList.forEach(name => {
-                const rec = map.get(name) || { basic_count: 0, preferred_count: 0 };
-                rec.basic_count += 1;
-                map.set(name, rec);
-            });
-            prefList.forEach(name => {
-                const rec = map.get(name) || { basic_count: 0, preferred_count: 0 };
-                rec.preferred_count += 1;
-                map.set(name, rec);
-            });
+            // A row's qualifications never change, so parse them once and
+            // reuse the lists on every later filter or page change
+            let lists = rowSkillLists.get(row);
+            if (lists === undefined) {
+                const details = row.querySelector('.details-container');
+                lists = details ? {
+                    basic: splitHtmlBullets(getNextPHtml(details, 'basic qualifications')),
+                    pref: splitHtmlBullets(getNextPHtml(details, 'preferred qualifications'))
+                } : null;
+                rowSkillLists.set(row, lists);
+            }
+            if (!lists) return;
+            const basicList = lists.basic;
+            const prefList = lists.pref;
+
+            basicList.forEach(name => { basicCounts[slotFor(name)] += 1; });
+            prefList.forEach(name => { prefCounts[slotFor(name)] += 1; });
         });
 
-        const arr = Array.from(map.entries()).map(([name, counts]) => [name, counts, counts.basic_count + counts.preferred_count]);
-        arr.sort((a, b) => b[2] - a[2]);
-        return arr;
+        const order = names.map((_, i) => i);
+        order.sort((a, b) => (basicCounts[b] + prefCounts[b]) - (basicCounts[a] + prefCounts[a]));
+        return order.map(i => [
+            names[i],
+            { basic_count: basicCounts[i], preferred_count: prefCounts[i] },
+            basicCounts[i] + prefCounts[i]
+        ]);
     }
 
     // Update pagination controls from a skills list
@@ -140,19 +179,13 @@ document.addEventListener('DOMContentLoaded', () => {
 
     function buildFacetCompanyCounts({ searchTerm, selectedCategory, selectedStatus }) {
         const counts = {};
-        rows.forEach(row => {
-            const roleText = row.children[0].querySelector('.summary-content').textContent.toLowerCase();
-            const companyTextRaw = row.children[1].textContent;
-            const companyText = companyTextRaw.trim();
-            const categoryText = row.children[2].textContent;
-            const statusText = row.children[4].textContent;
-
-            const matchesSearch = searchTerm === '' || roleText.includes(searchTerm) || companyText.toLowerCase().includes(searchTerm);
-            const matchesCategory = selectedCategory === '' || categoryText === selectedCategory;
-            const matchesStatus = selectedStatus === '' || statusText === selectedStatus;
+        rowFields.forEach(({ roleLower, company, companyLower, category, status }) => {
+            const matchesSearch = searchTerm === '' || roleLower.includes(searchTerm) || companyLower.includes(searchTerm);
+            const matchesCategory = selectedCategory === '' || category === selectedCategory;
+            const matchesStatus = selectedStatus === '' || status === selectedStatus;
 
             if (matchesSearch && matchesCategory && matchesStatus) {
-                counts[companyText] = (counts[companyText] || 0) + 1;
+                counts[company] = (counts[company] || 0) + 1;
             }
         });
         return counts;
@@ -512,17 +545,11 @@ document.addEventListener('DOMContentLoaded', () => {
         updateCompanyToggleLabel(selectedCompanies);
 
         // Apply DOM filtering for table rows
-        rows.forEach(row => {
-            const roleText = row.children[0].querySelector('.summary-content').textContent.toLowerCase();
-            const companyTextRaw = row.children[1].textContent;
-            const companyText = companyTextRaw.toLowerCase().trim();
-            const categoryText = row.children[2].textContent;
-            const statusText = row.children[4].textContent;
-
-            const matchesSearch = searchTerm === '' || roleText.includes(searchTerm) || companyText.includes(searchTerm);
-            const matchesCategory = selectedCategory === '' || categoryText === selectedCategory;
-            const matchesStatus = selectedStatus === '' || statusText === selectedStatus;
-            const matchesCompany = selectedCompanies.length === 0 || selectedCompanies.includes(companyTextRaw.trim());
+        rowFields.forEach(({ row, roleLower, company, companyLower, category, status }) => {
+            const matchesSearch = searchTerm === '' || roleLower.includes(searchTerm) || companyLower.includes(searchTerm);
+            const matchesCategory = selectedCategory === '' || category === selectedCategory;
+            const matchesStatus = selectedStatus === '' || status === selectedStatus;
+            const matchesCompany = selectedCompanies.length === 0 || selectedCompanies.includes(company);
 
             if (matchesSearch && matchesCategory && matchesStatus && matchesCompany) {
                 row.classList.remove('hidden');
@@ -574,30 +601,31 @@ document.addEventListener('DOMContentLoaded', () => {
     });
 
     function sortTable() {
-        console.log('sortTable function called!');
         const header = postingDateHeader;
-        // The actual column index for the 'Posted' date in the <td> elements is 3 now.
-        const columnIndex = 3;
 
         const currentRows = Array.from(tbody.querySelectorAll('tr.job-row:not(.hidden)'))
 
-
+        // Compare the timestamps parsed once at load instead of building two
+        // Date objects per comparison; undated rows (NaN) stay last either way
         currentRows.sort((a, b) => {
-            const aDateContent = a.children[columnIndex].textContent;
-            const bDateContent = b.children[columnIndex].textContent;
-            const aDate = new Date(aDateContent);
-            const bDate = new Date(bDateContent)
-
-
+            const aTime = rowPostedTime.get(a);
+            const bTime = rowPostedTime.get(b);
+            const aMissing = Number.isNaN(aTime);
+            const bMissing = Number.isNaN(bTime);
+            if (aMissing || bMissing) {
+                return aMissing - bMissing;
+            }
             if (sortDirection === 'asc') {
-                return aDate - bDate;
+                return aTime - bTime;
             } else {
-                return bDate - aDate;
+                return bTime - aTime;
             }
         });
 
-        // Remove existing rows and re-append sorted rows
-        currentRows.forEach(row => tbody.appendChild(row));
+        // Re-append sorted rows in one insertion via a fragment
+        const fragment = document.createDocumentFragment();
+        currentRows.forEach(row => fragment.appendChild(row));
+        tbody.appendChild(fragment);
 
         // Toggle sort direction and update header class
         header.classList.remove('sorted-asc', 'sorted-desc');
@@ -615,13 +643,17 @@ document.addEventListener('DOMContentLoaded', () => {
     // Initialize company options with overall counts, then render
     const initialCounts = buildFacetCompanyCounts({ searchTerm: '', selectedCategory: '', selectedStatus: '' });
     initializeCompanyMultiSelect(initialCounts);
-    // Initial sort on page load (newest jobs first)
-    sortTable();
     // Initial render of skills and pagination
     applyFilters({ resetPage: true });
 
     // Event listeners
-    searchInput.addEventListener('input', () => applyFilters({ resetPage: true }));
+    // Debounce typing so a burst of keystrokes triggers a single filter pass
+    const SEARCH_DEBOUNCE_MS = 120;
+    let searchTimer = null;
+    searchInput.addEventListener('input', () => {
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(() => applyFilters({ resetPage: true }), SEARCH_DEBOUNCE_MS);
+    });
     categoryFilter.addEventListener('change', () => {
         // Explicitly reset page on category change to ensure correct pagination
         currentPage = 1;
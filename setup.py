@@ -42,6 +42,14 @@ setup(
             "selenium>=4.8.0",
             "webdriver-manager>=3.8.0",
         ],
+        "speedups": [
+            "orjson>=3.8.0",
+            "brotli>=1.0.9",
+            "pyahocorasick>=2.0.0",
+        ],
+        "parquet": [
+            "pyarrow>=12.0.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",
@@ -2,7 +2,15 @@
 Core scraping functionality for Amazon Jobs Scraper
 """
 
-from .amazon_scraper import AmazonJobsScraper
 from .config import ScraperConfig
 
 __all__ = ["AmazonJobsScraper", "ScraperConfig"]
+
+
+def __getattr__(name):
+    # The scraper pulls in pandas/requests, so import it on first access only
+    if name == "AmazonJobsScraper":
+        from .amazon_scraper import AmazonJobsScraper
+
+        return AmazonJobsScraper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -33,6 +33,7 @@ from src.utils.paths import (
     get_raw_dir,
     get_raw_path,
 )  # type: ignore
+from src.utils.raw_storage import read_jobs_table, write_jobs_table  # type: ignore
 
 
 LOGGER = logging.getLogger(__name__)
@@ -109,7 +110,7 @@ def merge_with_active_flags(
     combined["active"] = combined["id"].astype(str).isin(seen_ids)
     combined["active"] = combined["active"].astype(bool)
 
-    active_count = int(combined["active"].sum()) if not combined.empty else 0
+    active_count = int(combined["active"].to_numpy(dtype=bool).sum())
     logger.info(
         "Updated active status: active=%d inactive=%d total=%d",
         active_count,
@@ -573,7 +574,7 @@ class AmazonAPIScraper:
         existing_df: pd.DataFrame = pd.DataFrame()
         try:
             if out_path.exists():
-                existing_df = pd.read_csv(out_path)
+                existing_df = read_jobs_table(out_path)
                 self.logger.info(
                     "Loaded existing raw CSV for merge: %s (%d rows)",
                     out_path,
@@ -586,7 +587,7 @@ class AmazonAPIScraper:
 
         # Write CSV only if requested
         if write_output:
-            final_df.to_csv(out_path, index=False)
+            write_jobs_table(final_df, out_path)
             self.logger.info(f"Wrote CSV: {out_path} ({len(final_df)} rows)")
         else:
             self.logger.debug("write_output=False; skipping CSV write to %s", out_path)
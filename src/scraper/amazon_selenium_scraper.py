@@ -27,7 +27,11 @@ from webdriver_manager.chrome import ChromeDriverManager
 
 from .config import ScraperConfig
 from src.utils.paths import get_raw_dir, get_backup_dir, get_raw_path  # type: ignore
-from src.utils.raw_storage import save_raw_jobs  # type: ignore
+from src.utils.raw_storage import (  # type: ignore
+    read_jobs_table,
+    save_raw_jobs,
+    write_jobs_table,
+)
 
 
 class AmazonSeleniumScraper:
@@ -234,7 +238,7 @@ class AmazonSeleniumScraper:
         csv_path = str(get_raw_path("amazon", self.config))
         if os.path.exists(csv_path):
             try:
-                existing_jobs_df = pd.read_csv(csv_path)
+                existing_jobs_df = read_jobs_table(Path(csv_path))
                 if "company" not in existing_jobs_df.columns:
                     existing_jobs_df["company"] = "Amazon"
                 if "source" not in existing_jobs_df.columns:
@@ -258,7 +262,7 @@ class AmazonSeleniumScraper:
             for idx, row in existing_df.iterrows():
                 job_id = str(row["id"])
                 existing_df.at[idx, "active"] = job_id in seen_job_ids
-            active_count = existing_df["active"].sum()
+            active_count = int(existing_df["active"].to_numpy(dtype=bool).sum())
             self.logger.info(
                 f"Updated active status: {active_count} active, {len(existing_df) - active_count} inactive"
             )
@@ -802,7 +806,7 @@ class AmazonSeleniumScraper:
                         "No job tiles found on the site; leaving existing 'active' flags unchanged"
                     )
                     output_path = get_raw_path("amazon", self.config)
-                    existing_df.to_csv(output_path, index=False)
+                    write_jobs_table(existing_df, output_path)
                     self.logger.debug(f"Saved existing data unchanged to {output_path}")
                     return existing_df
 
@@ -814,7 +818,7 @@ class AmazonSeleniumScraper:
                     for idx, row in existing_df.iterrows():
                         job_id = str(row["id"])
                         existing_df.at[idx, "active"] = job_id in self.seen_job_ids
-                    active_count = existing_df["active"].sum()
+                    active_count = int(existing_df["active"].to_numpy(dtype=bool).sum())
                     self.logger.info(
                         "Active summary: active=%d inactive=%d total=%d",
                         active_count,
@@ -822,7 +826,7 @@ class AmazonSeleniumScraper:
                         len(existing_df),
                     )
                 output_path = get_raw_path("amazon", self.config)
-                existing_df.to_csv(output_path, index=False)
+                write_jobs_table(existing_df, output_path)
                 self.logger.debug(f"Updated data saved to {output_path}")
                 return existing_df
 
@@ -860,10 +864,9 @@ class AmazonSeleniumScraper:
             execution_time = time.time() - start_time
             self.logger.info("=== SCRAPING COMPLETE ===")
             self.logger.info(f"Total jobs: {len(final_df)}")
-            self.logger.info(f"Active jobs: {final_df['active'].sum()}")
-            self.logger.info(
-                f"Inactive jobs: {len(final_df) - final_df['active'].sum()}"
-            )
+            active_count = int(final_df["active"].to_numpy(dtype=bool).sum())
+            self.logger.info(f"Active jobs: {active_count}")
+            self.logger.info(f"Inactive jobs: {len(final_df) - active_count}")
             self.logger.info(f"Execution time: {execution_time:.2f} seconds")
             self.logger.info("✅ Raw save completed")
             return final_df
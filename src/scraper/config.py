@@ -2,10 +2,26 @@
 Configuration management for Amazon Jobs Scraper
 """
 
+import copy
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, Optional
+
+
+@lru_cache(maxsize=1)
+def _load_config_yaml(path: str) -> Dict[str, Any]:
+    """
+    Parse the YAML configuration file once per process.
+
+    Every ScraperConfig() shares this result, so the file is read once even
+    though each scraper builds its own config. Callers receive a deep copy and
+    may mutate it freely; code that rewrites the file on disk must call
+    ``_load_config_yaml.cache_clear()`` for later instances to see the change.
+    """
+    with open(path, "r") as f:
+        return yaml.safe_load(f) or {}
 
 
 class ScraperConfig:
@@ -96,10 +112,9 @@ class ScraperConfig:
         # Load from YAML file if it exists
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, "r") as f:
-                    yaml_config = yaml.safe_load(f)
-                    if yaml_config:
-                        default_config.update(yaml_config)
+                yaml_config = _load_config_yaml(self.config_path)
+                if yaml_config:
+                    default_config.update(copy.deepcopy(yaml_config))
             except Exception as e:
                 print(f"Warning: Could not load config from {self.config_path}: {e}")
 
@@ -205,6 +220,9 @@ class ScraperConfig:
                     "theirstack.timeout_precheck": "sources.theirstack.timeout_precheck",
                     "theirstack.timeout_paid": "sources.theirstack.timeout_paid",
                     "theirstack.wide_fetch_limit": "sources.theirstack.wide_fetch_limit",
+                    "theirstack.http_concurrency": "sources.theirstack.http_concurrency",
+                    "theirstack.page_concurrency": "sources.theirstack.page_concurrency",
+                    "theirstack.wide_precheck_min_age_days": "sources.theirstack.wide_precheck_min_age_days",
                 }
                 alias_key = alias_map.get(key)
                 if alias_key and alias_key != key:
@@ -212,6 +230,50 @@ class ScraperConfig:
                 return default
         return value
 
+    def get_int(self, key: str, default: int) -> int:
+        """
+        Get an integer configuration value, failing loudly on bad input.
+
+        Args:
+            key: Configuration key (e.g., 'common.http_retries')
+            default: Value used when the key is missing or empty
+
+        Returns:
+            Configuration value as int
+
+        Raises:
+            ValueError: If the configured value is not a valid integer
+        """
+        return self._get_number(key, default, int)
+
+    def get_float(self, key: str, default: float) -> float:
+        """
+        Get a float configuration value, failing loudly on bad input.
+
+        Args:
+            key: Configuration key (e.g., 'common.http_backoff')
+            default: Value used when the key is missing or empty
+
+        Returns:
+            Configuration value as float
+
+        Raises:
+            ValueError: If the configured value is not a valid number
+        """
+        return self._get_number(key, default, float)
+
+    def _get_number(self, key: str, default: Any, cast: Callable[[Any], Any]) -> Any:
+        """Resolve ``key`` and convert it with ``cast``; missing/empty gives ``default``."""
+        value = self.get(key)
+        if value is None or value == "":
+            return default
+        try:
+            return cast(value)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"Invalid value for '{key}': expected {cast.__name__}, got {value!r}"
+            ) from None
+
     def get_scraper_config(self) -> Dict[str, Any]:
         """Get scraper-specific configuration."""
         return self._config.get("scraper", {})
@@ -256,6 +318,7 @@ class ScraperConfig:
 
         with open(save_path, "w") as f:
             yaml.safe_dump(self._config, f, default_flow_style=False, indent=2)
+        _load_config_yaml.cache_clear()
 
     def __str__(self) -> str:
         """String representation of configuration."""
@@ -1,9 +1,12 @@
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Optional
 import logging
 from src.scraper.config import ScraperConfig  # type: ignore
 from src.utils.raw_storage import save_raw_jobs  # type: ignore
-from src.utils.category_mapper import infer_job_category  # type: ignore
+from src.utils.category_mapper import (  # type: ignore
+    infer_job_categories_batch,
+    infer_job_category,
+)
 from src.utils.description_parser import parse_job_description  # type: ignore
 
 # Set up logging
@@ -17,8 +20,13 @@ logger = logging.getLogger(__name__)
 
 
 # Define the mapping between TheirStack fields and our format
-def _map_theirstack_to_our_format(job: Dict) -> Dict:
-    """Map TheirStack job data to our standard format"""
+def _map_theirstack_to_our_format(
+    job: Dict, job_category: Optional[str] = None
+) -> Dict:
+    """Map TheirStack job data to our standard format.
+
+    ``job_category`` may be passed in when it was already inferred for a batch.
+    """
     title = job.get("job_title", "")
     # Prefer final_url, fall back to url, then source_url
     url = job.get("final_url") or job.get("url") or job.get("source_url") or ""
@@ -28,7 +36,8 @@ def _map_theirstack_to_our_format(job: Dict) -> Dict:
     # Derive fields to match our dashboard expectations
     role = title  # Dashboard displays 'role' as the primary title text
     team = company or "External"
-    job_category = infer_job_category(job)
+    if job_category is None:
+        job_category = infer_job_category(job)
     description = job.get("description", "")
     parsed = parse_job_description(description)
 
@@ -72,7 +81,11 @@ def process_theirstack_jobs(jobs: List[Dict]) -> pd.DataFrame:
         return pd.DataFrame()
 
     # Convert jobs to our format
-    processed_jobs = [_map_theirstack_to_our_format(job) for job in jobs]
+    categories = infer_job_categories_batch(jobs)
+    processed_jobs = [
+        _map_theirstack_to_our_format(job, category)
+        for job, category in zip(jobs, categories)
+    ]
 
     # Create DataFrame and ensure consistent column order
     columns = [
@@ -126,6 +139,6 @@ if __name__ == "__main__":
     except ImportError as e:  # pragma: no cover - for direct script runs
         logger.debug(f"Could not import TheirStackScraper: {e}")
 
-    scraper = TheirStackScraper()
-    jobs = scraper.get_new_jobs()
+    with TheirStackScraper() as scraper:
+        jobs = scraper.get_new_jobs()
     process_theirstack_jobs(jobs)
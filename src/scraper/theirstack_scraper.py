@@ -1,5 +1,6 @@
+import gzip
 import os
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 import requests
 from requests.adapters import HTTPAdapter
@@ -7,20 +8,113 @@ from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
-import json
+from urllib.parse import urlsplit
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
 
 from src.utils.theirstack_state import TheirStackState  # type: ignore
+from src.scraper.theirstack_processor import process_theirstack_jobs  # type: ignore
 from src.scraper.config import ScraperConfig  # type: ignore
 from src.utils.paths import get_backup_dir  # type: ignore
 from src.utils.text_lang import job_is_english  # type: ignore
+from src.utils.json_compat import json_dumps, json_loads  # type: ignore
 
 load_dotenv()
 
 API_KEY = os.getenv("THEIR_STACK_API_KEY")
 
 
+def _page_body(base_body: bytes, limit: int, page: int) -> bytes:
+    """Splice per-page ``limit``/``page`` fields into a pre-encoded base payload.
+
+    ``base_body`` must be a non-empty JSON object as produced by json_dumps, so
+    the invariant filters are serialized once per loop rather than per page.
+    """
+    return b'%s,"limit":%d,"page":%d}' % (base_body[:-1], limit, page)
+
+
+def _utc_stamp() -> str:
+    """Current UTC time as ``YYYYMMDDTHHMMSSZ`` without going through strftime."""
+    return "%04d%02d%02dT%02d%02d%02dZ" % time.gmtime()[:6]
+
+
+# Optional extra title filters, grouped by category
+_TITLES_FILE = Path("config/theirstack_titles.json")
+
+
+def _titles_mtime_ns() -> Optional[int]:
+    """Modification time of the external titles file, or None when it is absent."""
+    try:
+        return os.stat(_TITLES_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _read_titles_file(path_str: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Parse a titles file into a flat tuple of titles.
+
+    ``mtime_ns`` is only part of the cache key, so an edited file is re-read.
+    """
+    with open(path_str, "rb") as f:
+        data = json_loads(f.read())
+    if isinstance(data, dict):
+        return tuple(str(x) for v in data.values() if isinstance(v, list) for x in v)
+    if isinstance(data, list):  # fallback if a flat list is provided
+        return tuple(str(x) for x in data)
+    return ()
+
+
+# HTTP retry/pool defaults; the matching adapter is built once and shared
+_DEFAULT_RETRIES = 3
+_DEFAULT_BACKOFF = 0.5
+_DEFAULT_POOL_SIZE = 8
+# Sequential paging unless page_concurrency opts in; concurrent pages still in
+# flight when a fetch stops early are billed
+_DEFAULT_PAGE_WAVE = 1
+
+
+def _build_retry(retries: int, backoff: float) -> Retry:
+    """Retry policy for transient TheirStack errors (429/5xx), honoring Retry-After."""
+    return Retry(
+        total=retries,
+        read=retries,
+        connect=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+
+
+def _build_adapter(retry: Retry, pool_size: int) -> HTTPAdapter:
+    """One keep-alive pool for the API host, sized to the request concurrency.
+
+    Page requests reuse these connections instead of re-handshaking.
+    """
+    return HTTPAdapter(
+        max_retries=retry,
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        pool_block=True,
+    )
+
+
+# Retry objects are immutable (each retry derives a new one), so the default
+# policy is shared; adapters own their connection pool and stay per session
+_DEFAULT_RETRY = _build_retry(_DEFAULT_RETRIES, _DEFAULT_BACKOFF)
+
+# Flush the gzipped backup stream after this many appended records
+_BACKUP_FLUSH_EVERY = 10
+# Bound on cached language verdicts and the description prefix used in their key
+_LANG_CACHE_SIZE = 4096
+_LANG_KEY_PREFIX = 256
+
+
 class TheirStackScraper:
     def __init__(self, config: Optional[ScraperConfig] = None):
         # Validate API key early for better DX (local runs) and clearer errors
@@ -46,57 +140,79 @@ class TheirStackScraper:
         # Backups directory
         self.backup_dir: Path = get_backup_dir(self.config)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
-
-        # HTTP session with retries/backoff for resilience
-        try:
-            retries = int(self.config.get("common.http_retries") or 3)
-        except Exception:
-            retries = 3
-        try:
-            backoff = float(self.config.get("common.http_backoff") or 0.5)
-        except Exception:
-            backoff = 0.5
+        # Backups are appended to one gzipped JSON-Lines file per day, opened lazily
+        self._backup_fh: Optional[gzip.GzipFile] = None
+        self._backup_pending = 0
+        # Language verdicts keyed by a cheap job fingerprint (see _is_english)
+        self._lang_cache: Dict[Tuple[str, str, int], bool] = {}
+
+        # HTTP session with retries/backoff for resilience (0 means the default)
+        retries = (
+            self.config.get_int("common.http_retries", _DEFAULT_RETRIES)
+            or _DEFAULT_RETRIES
+        )
+        backoff = (
+            self.config.get_float("common.http_backoff", _DEFAULT_BACKOFF)
+            or _DEFAULT_BACKOFF
+        )
+        concurrency = self.config.get_int(
+            "theirstack.http_concurrency", _DEFAULT_POOL_SIZE
+        )
+        # Result pages requested at once; each needs its own pooled connection
+        self.page_concurrency = max(
+            1, self.config.get_int("theirstack.page_concurrency", _DEFAULT_PAGE_WAVE)
+        )
+        concurrency = max(concurrency, self.page_concurrency)
 
         self.session = requests.Session()
-        retry = Retry(
-            total=retries,
-            read=retries,
-            connect=retries,
-            backoff_factor=backoff,
-            status_forcelist=(429, 500, 502, 503, 504),
-            allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
-            raise_on_status=False,
-            respect_retry_after_header=True,
-        )
-        adapter = HTTPAdapter(max_retries=retry)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
-        # Attach auth header to session to avoid repeating per request
+        if (retries, backoff) == (_DEFAULT_RETRIES, _DEFAULT_BACKOFF):
+            retry = _DEFAULT_RETRY
+        else:
+            retry = _build_retry(retries, backoff)
+        adapter = _build_adapter(retry, max(concurrency, _DEFAULT_POOL_SIZE))
+        api_parts = urlsplit(self.api_url)
+        self.session.mount(f"{api_parts.scheme}://{api_parts.netloc}", adapter)
+        # Attach auth header to session to avoid repeating per request; bodies are
+        # pre-encoded with json_dumps, so declare the content type once here too
         self.session.headers.update(self.headers)
-
-        # Timeouts (seconds)
-        try:
-            self.timeout_precheck = int(
-                self.config.get("theirstack.timeout_precheck") or 25
-            )
-        except Exception:
-            self.timeout_precheck = 25
-        try:
-            self.timeout_paid = int(self.config.get("theirstack.timeout_paid") or 15)
-        except Exception:
-            self.timeout_paid = 15
+        self.session.headers["Content-Type"] = "application/json"
+        # requests' default Accept-Encoding already lists br once its decoder is
+        # installed (see the 'speedups' extra), so responses arrive compressed
+        self.session.headers["Accept"] = "application/json"
+
+        # Timeouts (seconds); 0 means the default, as requests rejects a 0 timeout
+        self.timeout_precheck = (
+            self.config.get_int("theirstack.timeout_precheck", 25) or 25
+        )
+        self.timeout_paid = self.config.get_int("theirstack.timeout_paid", 15) or 15
 
         # Optional rate limiting between requests
-        try:
-            self.min_interval = float(
-                self.config.get("common.http_min_interval_seconds") or 0.0
-            )
-        except Exception:
-            self.min_interval = 0.0
-        try:
-            self.jitter = float(self.config.get("common.http_jitter_seconds") or 0.0)
-        except Exception:
-            self.jitter = 0.0
+        self.min_interval = self.config.get_float(
+            "common.http_min_interval_seconds", 0.0
+        )
+        self.jitter = self.config.get_float("common.http_jitter_seconds", 0.0)
+
+        # Search knobs, resolved once so bad values fail here rather than mid-run
+        self.page_size = int(self.config.get("theirstack.page_size"))
+        self.max_jobs_per_run = int(self.config.get("theirstack.max_jobs_per_run"))
+        self.max_excluded_ids = int(self.config.get("theirstack.max_excluded_ids"))
+        self.max_age_days = int(self.config.get("theirstack.posted_at_max_age_days"))
+        self.country_codes: List[str] = self.config.get(
+            "theirstack.job_country_code_or", ["LU"]
+        )  # default LU
+        self.english_only = bool(self.config.get("theirstack.english_only"))
+        # Cap on the wide-window fetch (0 disables it); also sizes the fallback
+        self.wide_fetch_limit = self.config.get_int("theirstack.wide_fetch_limit", 10)
+        # Only run the wide pre-check once the last run is at least this many days
+        # old; recent runs already covered the window (0 = always run it)
+        self.wide_precheck_min_age_days = self.config.get_int(
+            "theirstack.wide_precheck_min_age_days", self.max_age_days // 2
+        )
+        # YAML titles merged with config/theirstack_titles.json, keyed by its mtime
+        self._title_cache: Optional[Tuple[Optional[int], List[str]]] = (
+            _titles_mtime_ns(),
+            self._build_title_filters(),
+        )
 
     def _load_external_titles(self) -> List[str]:
         """Load additional job titles from config/theirstack_titles.json if present.
@@ -104,37 +220,78 @@ class TheirStackScraper:
         The JSON is expected to be an object whose values are arrays of strings
         (grouped by category). We flatten values and return a simple list.
         """
+        mtime_ns = _titles_mtime_ns()
+        if mtime_ns is None:
+            return []
         try:
-            titles_path = Path("config/theirstack_titles.json")
-            if titles_path.exists():
-                with open(titles_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, dict):
-                    merged: List[str] = []
-                    for v in data.values():
-                        if isinstance(v, list):
-                            merged.extend([str(x) for x in v])
-                    return merged
-                if isinstance(data, list):  # fallback if a flat list is provided
-                    return [str(x) for x in data]
+            return list(_read_titles_file(str(_TITLES_FILE), mtime_ns))
         except Exception as e:  # pragma: no cover - defensive only
             self.logger.warning("Failed to load external titles: %s", e)
         return []
 
+    @property
+    def title_filters(self) -> List[str]:
+        """Merged title filters, rebuilt only when the external titles file changes."""
+        mtime_ns = _titles_mtime_ns()
+        cached = self._title_cache
+        if cached is None or cached[0] != mtime_ns:
+            cached = self._title_cache = (mtime_ns, self._build_title_filters())
+        return cached[1]
+
+    def _build_title_filters(self) -> List[str]:
+        """Return the YAML title filters merged with the external titles file."""
+        title_filters = self.config.get("theirstack.job_title_or") or []
+        try:
+            external_titles = self._load_external_titles()
+            if external_titles:
+                title_filters = self._merge_titles(title_filters, external_titles)
+        except Exception as e:  # pragma: no cover - defensive only
+            self.logger.warning("Title merge failed: %s", e)
+        return title_filters
+
     @staticmethod
     def _merge_titles(base: List[str], extra: List[str]) -> List[str]:
         """Merge two title lists, deduping case-insensitively while preserving order.
 
         Returns a new list.
         """
-        seen = set()
-        out: List[str] = []
-        for title in list(base) + list(extra):
+        merged: Dict[str, str] = {}
+        for title in chain(base, extra):
             key = title.strip().lower()
-            if key and key not in seen:
-                seen.add(key)
-                out.append(title)
-        return out
+            if key:
+                merged.setdefault(key, title)
+        return list(merged.values())
+
+    def _backup_handle(self) -> gzip.GzipFile:
+        """Return the append handle for today's backup file, opening it on first use."""
+        fh = self._backup_fh
+        if fh is None:
+            date = datetime.utcnow().strftime("%Y%m%d")
+            out_path = self.backup_dir / f"theirstack_{date}.jsonl.gz"
+            fh = self._backup_fh = gzip.GzipFile(out_path, "ab")
+            self.logger.info("Appending TheirStack response backups to %s", out_path)
+        return fh
+
+    def close(self) -> None:
+        """Flush the backup file and release pooled connections.
+
+        Safe to call more than once; runs on leaving the ``with`` block.
+        """
+        fh = self._backup_fh
+        if fh is not None:
+            self._backup_fh = None
+            self._backup_pending = 0
+            try:
+                fh.close()
+            except Exception as e:  # pragma: no cover - guardrails only
+                self.logger.warning("Failed to close TheirStack backup file: %s", e)
+        self.session.close()
+
+    def __enter__(self) -> "TheirStackScraper":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def _save_response_backup(
         self,
@@ -143,7 +300,11 @@ class TheirStackScraper:
         request_payload: Dict,
         page: Optional[int] = None,
     ) -> None:
-        """Persist the full API response (and request payload) under data/backups.
+        """Append the full API response (and request payload) to the daily backup.
+
+        Records are written one JSON object per line into a gzipped file under
+        the backup dir. The handle is flushed every ``_BACKUP_FLUSH_EVERY``
+        records and on close, so pagination is not blocked by a write per page.
 
         Args:
             kind: 'precheck' or 'page'
@@ -152,40 +313,83 @@ class TheirStackScraper:
             page: Page number for paginated calls (optional)
         """
         try:
-            ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-            page_sfx = f"_p{page}" if page is not None else ""
-            fname = f"theirstack_response_{kind}_{ts}{page_sfx}.json"
-            out_path = self.backup_dir / fname
-            payload = {
-                "timestamp_utc": ts,
+            record = {
+                "timestamp_utc": _utc_stamp(),
                 "kind": kind,
                 "page": page,
                 "request_payload": request_payload,
                 "response": response_json,
             }
-            with open(out_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
-            self.logger.info(f"Saved TheirStack {kind} response backup: {out_path}")
+            fh = self._backup_handle()
+            fh.write(json_dumps(record) + b"\n")
+            self._backup_pending += 1
+            if self._backup_pending >= _BACKUP_FLUSH_EVERY:
+                fh.flush()
+                self._backup_pending = 0
+            self.logger.debug(
+                "Saved TheirStack %s response backup (page=%s)", kind, page
+            )
         except Exception as e:  # pragma: no cover - guardrails only
             self.logger.warning(
-                f"Failed to save TheirStack {kind} response backup: {e}"
+                "Failed to save TheirStack %s response backup: %s", kind, e
             )
 
+    def _is_english(self, job: Dict) -> bool:
+        """Memoized job_is_english keyed by title + description prefix/length.
+
+        TheirStack re-returns overlapping postings once the job_id_not list is
+        capped, so repeats skip language detection entirely.
+        """
+        title = job.get("job_title") or job.get("title") or ""
+        desc = job.get("description") or ""
+        key = (title, desc[:_LANG_KEY_PREFIX], len(desc))
+        cache = self._lang_cache
+        verdict = cache.get(key)
+        if verdict is None:
+            verdict = job_is_english(job)
+            if len(cache) >= _LANG_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del cache[next(iter(cache))]
+            cache[key] = verdict
+        return verdict
+
+    def _make_predicate(
+        self, english_only: bool, counts: Dict[str, int]
+    ) -> Callable[[Dict], bool]:
+        """Build the per-job keep test for one fetch, decided once per run.
+
+        The returned closure keeps unseen jobs and, when ``english_only`` is set,
+        only English ones; it adds each unseen job dropped by the language check
+        to ``counts["non_english"]``.
+        """
+        # Test membership on the state's ID set directly (O(1), no method call)
+        seen = self.state.scraped_job_ids
+        if not english_only:
+            return lambda job: str(job["id"]) not in seen
+
+        is_en = self._is_english
+
+        def keep(job: Dict) -> bool:
+            if str(job["id"]) in seen:
+                return False
+            if is_en(job):
+                return True
+            counts["non_english"] += 1
+            return False
+
+        return keep
+
     def get_new_jobs(self) -> List[Dict]:
         """
         Fetches new jobs from the TheirStack API since the last run.
         """
-        # Configurable pagination and daily cap (YAML-driven)
-        page_size = int(self.config.get("theirstack.page_size"))
-        max_jobs_per_run = int(self.config.get("theirstack.max_jobs_per_run"))
-        max_excluded_ids = int(self.config.get("theirstack.max_excluded_ids"))
         # Log current state snapshot
         self.logger.info(
             "State snapshot before request: last_run_date=%s, seen_ids=%d, page_size=%d, max_jobs_per_run=%d",
             self.state.get_last_run_date(),
             len(self.state.scraped_job_ids),
-            page_size,
-            max_jobs_per_run,
+            self.page_size,
+            self.max_jobs_per_run,
         )
         # Calculate the date for the last run
         last_run_date = self.state.get_last_run_date()
@@ -196,40 +400,36 @@ class TheirStackScraper:
             # First run: get jobs from the last 24 hours
             posted_at_gte = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
 
-        # Prepare exclusion list of already seen job IDs (normalized as strings)
-        seen_ids = list(self.state.scraped_job_ids)
-        if max_excluded_ids and len(seen_ids) > max_excluded_ids:
-            seen_ids = seen_ids[:max_excluded_ids]
+        # Prepare exclusion list of already seen job IDs (normalized as strings).
+        # Built once per run and shared by every payload; when capped, keep the
+        # most recently scraped IDs since older postings age out of the window.
+        seen_ids = self.state.recent_job_ids(self.max_excluded_ids)
 
-        # Build title filters and max age window from YAML, then merge external list if present
-        title_filters = self.config.get("theirstack.job_title_or") or []
-        try:
-            external_titles = self._load_external_titles()
-            if external_titles:
-                title_filters = self._merge_titles(title_filters, external_titles)
-        except Exception as e:  # pragma: no cover - defensive only
-            self.logger.warning("Title merge failed: %s", e)
-        max_age_days = int(self.config.get("theirstack.posted_at_max_age_days"))
-        country_codes = self.config.get(
-            "theirstack.job_country_code_or", ["LU"]
-        )  # default LU
-        english_only = bool(self.config.get("theirstack.english_only"))
+        title_filters = self.title_filters
+        country_codes = self.country_codes
+        max_age_days = self.max_age_days
 
-        # First, make a free request to check if there are any unseen jobs
-        check_payload = {
+        # Filters shared by the pre-check and every paginated request
+        page_filters = {
             "posted_at_gte": posted_at_gte,
             "job_country_code_or": country_codes,
             "posted_at_max_age_days": max_age_days,
             "job_title_or": title_filters,
-            "limit": 1,
-            "blur_company_data": True,
-            "include_total_results": True,
+            # Reduce paid duplicates as an extra safeguard
             "job_id_not": seen_ids,
             # Request newest jobs first to reduce paging
             "order_by": [{"desc": True, "field": "date_posted"}],
             # Prefer ATS/clean URLs to reduce low-signal rows
             "property_exists_or": ["final_url"],
         }
+
+        # First, make a free request to check if there are any unseen jobs
+        check_payload = {
+            **page_filters,
+            "limit": 1,
+            "blur_company_data": True,
+            "include_total_results": True,
+        }
         try:
             # Log a concise snapshot of the pre-check payload (avoid overly verbose logs)
             seen_preview = ", ".join(seen_ids[:10]) if seen_ids else ""
@@ -247,11 +447,11 @@ class TheirStackScraper:
             start_ts = time.monotonic()
             response = self.session.post(
                 self.api_url,
-                json=check_payload,
+                data=json_dumps(check_payload),
                 timeout=(5, self.timeout_precheck),
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             # Persist pre-check response for offline analysis
             self._save_response_backup("precheck", data, check_payload)
             meta_obj = data.get("metadata") or data.get("meta") or {}
@@ -269,6 +469,13 @@ class TheirStackScraper:
                     max_age_days,
                     len(seen_ids),
                 )
+                if self._last_run_is_recent(last_run_date):
+                    self.logger.info(
+                        "Skipping wide pre-check: last run %s is within %d day(s).",
+                        last_run_date,
+                        self.wide_precheck_min_age_days,
+                    )
+                    return []
                 # Debug: run a wide pre-check over the full max_age_days window to verify if older jobs exist
                 try:
                     wide_gte = (
@@ -286,11 +493,11 @@ class TheirStackScraper:
                     )
                     wresp = self.session.post(
                         self.api_url,
-                        json=wide_payload,
+                        data=json_dumps(wide_payload),
                         timeout=(5, self.timeout_precheck),
                     )
                     wresp.raise_for_status()
-                    wdata = wresp.json()
+                    wdata = json_loads(wresp.content)
                     self._save_response_backup("precheck_wide", wdata, wide_payload)
                     wmeta = wdata.get("metadata") or wdata.get("meta") or {}
                     wtotal = int(
@@ -303,155 +510,19 @@ class TheirStackScraper:
                     )
 
                     # Option A: If wide pre-check finds results, do a limited paid fetch from the wide window
-                    wide_cap = self.config.get("theirstack.wide_fetch_limit")
-                    try:
-                        wide_fetch_limit = int(wide_cap) if wide_cap is not None else 10
-                    except Exception:
-                        wide_fetch_limit = 10
-
-                    if wtotal > 0 and wide_fetch_limit > 0:
-                        target_to_fetch = min(wtotal, wide_fetch_limit)
+                    if wtotal > 0 and self.wide_fetch_limit > 0:
+                        target_to_fetch = min(wtotal, self.wide_fetch_limit)
                         self.logger.info(
                             "Proceeding with limited wide fetch: cap=%d from posted_at_gte=%s",
                             target_to_fetch,
                             wide_gte,
                         )
 
-                        collected_jobs: List[Dict] = []
-                        page = 0
-                        pages_wide = 0
-                        while len(collected_jobs) < target_to_fetch:
-                            remaining = target_to_fetch - len(collected_jobs)
-                            current_limit = min(page_size, remaining)
-                            payload = {
-                                "posted_at_gte": wide_gte,
-                                "job_country_code_or": country_codes,
-                                "posted_at_max_age_days": max_age_days,
-                                "job_title_or": title_filters,
-                                "limit": current_limit,
-                                "page": page,
-                                "job_id_not": seen_ids,
-                                # Request newest-first and trim to higher-signal rows
-                                "order_by": [{"desc": True, "field": "date_posted"}],
-                                "property_exists_or": ["final_url"],
-                            }
-                            try:
-                                self.logger.info(
-                                    "[wide] Sending request page=%d limit=%d posted_at_gte=%s titles=%d exclude_ids=%d",
-                                    page,
-                                    current_limit,
-                                    wide_gte,
-                                    len(title_filters),
-                                    len(seen_ids),
-                                )
-                                response = self.session.post(
-                                    self.api_url,
-                                    json=payload,
-                                    timeout=self.timeout_paid,
-                                )
-                                response.raise_for_status()
-                                data = response.json()
-                                self._save_response_backup(
-                                    "page_wide", data, payload, page=page
-                                )
-
-                                # If API indicates truncation due to credits, stop early
-                                wmeta_obj = (
-                                    data.get("metadata") or data.get("meta") or {}
-                                )
-                                wtrunc = int(wmeta_obj.get("truncated_results") or 0)
-                                wtrunc_companies = int(
-                                    wmeta_obj.get("truncated_companies") or 0
-                                )
-                                if wtrunc or wtrunc_companies:
-                                    self.logger.warning(
-                                        "[wide] API truncation: results=%d companies=%d; stopping.",
-                                        wtrunc,
-                                        wtrunc_companies,
-                                    )
-                                    break
-
-                                jobs = data.get("data", [])
-                                if not jobs:
-                                    self.logger.info(
-                                        "[wide] No more jobs returned; stopping pagination at page %d.",
-                                        page,
-                                    )
-                                    break
-
-                                page_new_jobs = [
-                                    job
-                                    for job in jobs
-                                    if self.state.is_job_new(str(job["id"]))
-                                ]
-                                if english_only:
-                                    before_cnt = len(page_new_jobs)
-                                    page_new_jobs = [
-                                        j for j in page_new_jobs if job_is_english(j)
-                                    ]
-                                    self.logger.info(
-                                        "[wide] English filter kept %d/%d",
-                                        len(page_new_jobs),
-                                        before_cnt,
-                                    )
-                                try:
-                                    id_preview = ", ".join(
-                                        str(j["id"]) for j in jobs[:5]
-                                    )
-                                except Exception:
-                                    id_preview = ""
-                                self.logger.info(
-                                    "[wide] Page %d results=%d new=%d dup=%d ids=[%s]",
-                                    page,
-                                    len(jobs),
-                                    len(page_new_jobs),
-                                    len(jobs) - len(page_new_jobs),
-                                    id_preview,
-                                )
-
-                                collected_jobs.extend(page_new_jobs)
-                                pages_wide += 1
-                                if len(jobs) < current_limit:
-                                    self.logger.info(
-                                        "[wide] Last page reached at page %d (returned=%d < limit=%d).",
-                                        page,
-                                        len(jobs),
-                                        current_limit,
-                                    )
-                                    break
-                                page += 1
-                                # Sleep between requests if configured
-                                if self.min_interval > 0:
-                                    delay = self.min_interval + (
-                                        random.uniform(0, self.jitter)
-                                        if self.jitter > 0
-                                        else 0.0
-                                    )
-                                    self.logger.debug(
-                                        f"[wide] Sleeping {delay:.2f}s before next page request"
-                                    )
-                                    time.sleep(delay)
-                            except Exception as fe:
-                                self.logger.error("[wide] Error fetching jobs: %s", fe)
-                                break
-
-                        # Persist state and process
-                        for job in collected_jobs:
-                            self.state.add_job_id(str(job["id"]))
-                        self.state.update_last_run()
-                        self.state.save_state()
-
-                        from src.scraper.theirstack_processor import (
-                            process_theirstack_jobs,
-                        )
-
-                        process_theirstack_jobs(collected_jobs)
-                        self.logger.info(
-                            "Wide fetch summary: pages=%d collected=%d target=%d",
-                            pages_wide,
-                            len(collected_jobs),
-                            target_to_fetch,
+                        wide_base = {**page_filters, "posted_at_gte": wide_gte}
+                        collected_jobs, _ = self._paginated_fetch(
+                            wide_base, target_to_fetch, "wide"
                         )
+                        self._persist_and_process(collected_jobs)
                         return collected_jobs
                 except Exception as we:
                     self.logger.warning("Wide pre-check failed: %s", we)
@@ -462,251 +533,296 @@ class TheirStackScraper:
         except requests.exceptions.ReadTimeout as e:
             # Fallback: attempt a limited paid fetch to avoid missing jobs due to transient slowness
             self.logger.warning(
-                f"Pre-check read timeout after {self.timeout_precheck}s: {e}. Proceeding with limited paid fetch fallback."
+                "Pre-check read timeout after %ss: %s. Proceeding with limited paid fetch fallback.",
+                self.timeout_precheck,
+                e,
             )
             try:
                 # Determine a small fallback target
-                try:
-                    fallback_limit = int(
-                        self.config.get("theirstack.wide_fetch_limit") or 10
-                    )
-                except Exception:
-                    fallback_limit = 10
-                fallback_limit = max(1, fallback_limit)
-
-                page_size = int(self.config.get("theirstack.page_size"))
-                current_limit = min(page_size, fallback_limit)
-
-                payload = {
-                    "posted_at_gte": posted_at_gte,
-                    "job_country_code_or": country_codes,
-                    "posted_at_max_age_days": max_age_days,
-                    "job_title_or": title_filters,
-                    "limit": current_limit,
-                    "page": 0,
-                    "job_id_not": seen_ids,
-                    "order_by": [{"desc": True, "field": "date_posted"}],
-                    "property_exists_or": ["final_url"],
-                }
-                self.logger.info(
-                    "[fallback] Sending limited paid fetch: limit=%d posted_at_gte=%s titles=%d exclude_ids=%d",
-                    current_limit,
-                    posted_at_gte,
-                    len(title_filters),
-                    len(seen_ids),
-                )
-                resp = self.session.post(
-                    self.api_url,
-                    json=payload,
-                    timeout=(5, self.timeout_paid),
-                )
-                resp.raise_for_status()
-                fdata = resp.json()
-                self._save_response_backup("page_fallback", fdata, payload, page=0)
+                fallback_limit = max(1, self.wide_fetch_limit or 10)
 
-                jobs = fdata.get("data", [])
-                if not jobs:
-                    self.logger.info(
-                        "[fallback] No jobs returned on limited paid fetch."
+                page_new_jobs, failed = self._paginated_fetch(
+                    page_filters, fallback_limit, "fallback"
+                )
+                if failed:
+                    # The API is still struggling; leave the state untouched so
+                    # the next run re-requests this window instead of skipping it
+                    self.logger.error(
+                        "[fallback] Limited paid fetch failed; state not updated."
                     )
                     return []
-
-                # Filter new and English-only if configured
-                page_new_jobs = [
-                    job for job in jobs if self.state.is_job_new(str(job["id"]))
-                ]
-                english_only = bool(self.config.get("theirstack.english_only"))
-                if english_only:
-                    before_cnt = len(page_new_jobs)
-                    page_new_jobs = [j for j in page_new_jobs if job_is_english(j)]
-                    self.logger.info(
-                        "[fallback] English filter kept %d/%d",
-                        len(page_new_jobs),
-                        before_cnt,
-                    )
-
-                # Persist state and process
-                for job in page_new_jobs:
-                    self.state.add_job_id(str(job["id"]))
-                self.state.update_last_run()
-                self.state.save_state()
-
-                from src.scraper.theirstack_processor import process_theirstack_jobs
-
-                process_theirstack_jobs(page_new_jobs)
-                self.logger.info(
-                    "[fallback] Completed limited paid fetch: returned=%d new=%d",
-                    len(jobs),
-                    len(page_new_jobs),
-                )
+                self._persist_and_process(page_new_jobs)
                 return page_new_jobs
             except Exception as fe:
-                self.logger.error(f"[fallback] Failed limited paid fetch: {fe}")
+                self.logger.error("[fallback] Failed limited paid fetch: %s", fe)
                 return []
         except Exception as e:
-            self.logger.error(f"Pre-check request failed: {e}")
+            self.logger.error("Pre-check request failed: %s", e)
             return []
 
         # Determine how many to fetch this run (respect daily cap)
-        target_to_fetch = min(total_jobs, max_jobs_per_run)
+        target_to_fetch = min(total_jobs, self.max_jobs_per_run)
         self.logger.info(
             "Proceeding with paid fetch: total_results=%d target_to_fetch=%d page_size=%d",
             total_jobs,
             target_to_fetch,
-            page_size,
+            self.page_size,
         )
 
         # Now make the paid, paginated requests
-        collected_jobs: List[Dict] = []
-        page = 0
-        pages_paid = 0
-        while len(collected_jobs) < target_to_fetch:
-            remaining = target_to_fetch - len(collected_jobs)
-            current_limit = min(page_size, remaining)
-            payload = {
-                "posted_at_gte": posted_at_gte,
-                "job_country_code_or": country_codes,
-                "posted_at_max_age_days": max_age_days,
-                "job_title_or": title_filters,
-                "limit": current_limit,
-                "page": page,
-                # Reduce paid duplicates as an extra safeguard
-                "job_id_not": seen_ids,
-                # Request newest-first and trim to higher-signal rows
-                "order_by": [{"desc": True, "field": "date_posted"}],
-                "property_exists_or": ["final_url"],
-            }
-            try:
-                self.logger.info(
-                    "Sending request page=%d limit=%d posted_at_gte=%s titles=%d exclude_ids=%d",
-                    page,
-                    current_limit,
-                    posted_at_gte,
-                    len(title_filters),
-                    len(seen_ids),
-                )
-                response = self.session.post(
-                    self.api_url,
-                    json=payload,
-                    timeout=(5, self.timeout_paid),
-                )
-                response.raise_for_status()
-                data = response.json()
-                # Persist paginated response for offline analysis
-                self._save_response_backup("page", data, payload, page=page)
-
-                # If API indicates truncation due to credits, stop early
-                meta_obj = data.get("metadata") or data.get("meta") or {}
-                trunc = int(meta_obj.get("truncated_results") or 0)
-                trunc_companies = int(meta_obj.get("truncated_companies") or 0)
-                if trunc or trunc_companies:
-                    self.logger.warning(
-                        "API truncation: results=%d companies=%d; stopping.",
-                        trunc,
-                        trunc_companies,
-                    )
-                    break
+        collected_jobs, _ = self._paginated_fetch(
+            page_filters, target_to_fetch, "paid"
+        )
+        # Update state and persist even if zero were collected to advance last run
+        self._persist_and_process(collected_jobs)
+        return collected_jobs
 
-                # Extract page results
-                jobs = data.get("data", [])
-                if not jobs:
-                    self.logger.info(
-                        "No more jobs returned; stopping pagination at page %d.", page
-                    )
-                    break
+    def _post_page(self, body: bytes) -> bytes:
+        """POST one pre-encoded page request and return the decoded response body.
 
-                # Filter out any that may still be considered seen
-                page_new_jobs = [
-                    job for job in jobs if self.state.is_job_new(str(job["id"]))
-                ]
-                if english_only:
-                    before_cnt = len(page_new_jobs)
-                    page_new_jobs = [j for j in page_new_jobs if job_is_english(j)]
-                    self.logger.info(
-                        "English filter kept %d/%d", len(page_new_jobs), before_cnt
-                    )
-                try:
-                    id_preview = ", ".join(str(j["id"]) for j in jobs[:5])
-                except Exception:
-                    id_preview = ""
-                self.logger.info(
-                    "Page %d results=%d new=%d dup=%d ids=[%s]",
-                    page,
-                    len(jobs),
-                    len(page_new_jobs),
-                    len(jobs) - len(page_new_jobs),
-                    id_preview,
-                )
+        Raises:
+            requests.HTTPError: If the final (post-retry) status is 4xx/5xx
+        """
+        # Sent through the session so its proxy settings, CA bundle and the
+        # mounted adapter's keep-alive pool and retry policy all apply
+        response = self.session.post(
+            self.api_url, data=body, timeout=(5, self.timeout_paid)
+        )
+        response.raise_for_status()
+        return response.content
 
-                collected_jobs.extend(page_new_jobs)
-                pages_paid += 1
+    def _last_run_is_recent(self, last_run_date: Optional[str]) -> bool:
+        """True when the last run (YYYY-MM-DD) is newer than the wide pre-check threshold."""
+        if not last_run_date or self.wide_precheck_min_age_days <= 0:
+            return False
+        try:
+            last = datetime.strptime(last_run_date, "%Y-%m-%d")
+        except ValueError:
+            return False
+        return (datetime.now() - last).days < self.wide_precheck_min_age_days
+
+    def _paginated_fetch(
+        self,
+        base_payload: Dict,
+        target: int,
+        label: str,
+    ) -> Tuple[List[Dict], bool]:
+        """Page through TheirStack results until ``target`` new jobs are collected.
+
+        Pages are requested in waves of up to ``page_concurrency`` concurrent
+        POSTs, planned as if every result were new so a wave never asks for more
+        than the remaining target. Responses are handled in page order, and the
+        fetch stops early on API truncation (credits exhausted), an empty page,
+        a short (last) page, or a request error.
 
-                # If fewer than requested returned, likely end of results
-                if len(jobs) < current_limit:
+        Args:
+            base_payload: Filters shared by every page (without limit/page)
+            target: Maximum number of new jobs to collect
+            label: 'paid', 'wide' or 'fallback'; used for logs and backup kinds
+
+        Returns:
+            The new jobs collected, in API order, and whether the fetch stopped
+            on a request error (so the collected jobs may be incomplete).
+        """
+        kind = "page" if label == "paid" else f"page_{label}"
+        base_body = json_dumps(base_payload)
+        counts = {"non_english": 0}
+        keep = self._make_predicate(self.english_only, counts)
+        collected_jobs: List[Dict] = []
+        failed = False
+        page = 0
+        pages_fetched = 0
+        executor: Optional[ThreadPoolExecutor] = None
+        if self.page_concurrency > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=self.page_concurrency, thread_name_prefix="theirstack"
+            )
+        try:
+            while len(collected_jobs) < target:
+                # Plan the next wave of (page, limit) pairs
+                wave: List[Tuple[int, int]] = []
+                planned = target - len(collected_jobs)
+                while planned > 0 and len(wave) < self.page_concurrency:
+                    limit = min(self.page_size, planned)
+                    wave.append((page + len(wave), limit))
+                    planned -= limit
+
+                for wave_page, limit in wave:
                     self.logger.info(
-                        "Last page reached at page %d (returned=%d < limit=%d).",
-                        page,
-                        len(jobs),
-                        current_limit,
+                        "[%s] Sending request page=%d limit=%d posted_at_gte=%s titles=%d exclude_ids=%d",
+                        label,
+                        wave_page,
+                        limit,
+                        base_payload.get("posted_at_gte"),
+                        len(base_payload.get("job_title_or") or []),
+                        len(base_payload.get("job_id_not") or []),
                     )
+                wave_started = time.monotonic()
+                bodies = [_page_body(base_body, limit, p) for p, limit in wave]
+                if executor is not None and len(wave) > 1:
+                    futures = [executor.submit(self._post_page, b) for b in bodies]
+                    responses = [future.result for future in futures]
+                else:
+                    responses = [partial(self._post_page, b) for b in bodies]
+
+                stop = False
+                for (wave_page, limit), response in zip(wave, responses):
+                    try:
+                        data = json_loads(response())
+                    except Exception as e:
+                        self.logger.error("[%s] Error fetching jobs: %s", label, e)
+                        failed = stop = True
+                        break
+                    payload = {**base_payload, "limit": limit, "page": wave_page}
+                    page_new_jobs, stop = self._handle_page(
+                        data, payload, kind, label, keep, counts
+                    )
+                    if page_new_jobs is not None:
+                        collected_jobs.extend(page_new_jobs)
+                        pages_fetched += 1
+                    if stop or len(collected_jobs) >= target:
+                        break
+                if stop or len(collected_jobs) >= target:
                     break
+                page += len(wave)
 
-                # Sleep between requests if configured
+                # Throttle if configured; time already spent on this wave counts
+                # towards min_interval, so only the remainder (plus jitter) is slept
                 if self.min_interval > 0:
-                    delay = self.min_interval + (
-                        random.uniform(0, self.jitter) if self.jitter > 0 else 0.0
-                    )
-                    self.logger.debug(f"Sleeping {delay:.2f}s before next page request")
-                    time.sleep(delay)
-
-                page += 1
-            except Exception as e:
-                self.logger.error(f"Error fetching jobs: {e}")
-                break
+                    elapsed = time.monotonic() - wave_started
+                    delay = max(0.0, self.min_interval - elapsed)
+                    if self.jitter > 0:
+                        delay += random.random() * self.jitter
+                    if delay > 0:
+                        self.logger.debug(
+                            "[%s] Sleeping %.2fs before next page request",
+                            label,
+                            delay,
+                        )
+                        time.sleep(delay)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
         self.logger.info(
-            "Paid fetch summary: pages=%d collected=%d target=%d",
-            pages_paid,
+            "[%s] Fetch summary: pages=%d collected=%d target=%d",
+            label,
+            pages_fetched,
             len(collected_jobs),
-            target_to_fetch,
+            target,
         )
-        # Update state and persist when we have collected something (or even if zero to advance last run)
-        for job in collected_jobs:
-            self.state.add_job_id(str(job["id"]))
+        return collected_jobs, failed
 
-        # Update last run date and persist
-        self.state.update_last_run()
-        self.state.save_state()
+    def _handle_page(
+        self,
+        data: Dict,
+        payload: Dict,
+        kind: str,
+        label: str,
+        keep: Callable[[Dict], bool],
+        counts: Dict[str, int],
+    ) -> Tuple[Optional[List[Dict]], bool]:
+        """Back up, check and filter one page response.
+
+        Returns:
+            The page's new jobs (None when the page yielded no results to count)
+            and whether pagination should stop after this page.
+        """
+        page = payload["page"]
+        limit = payload["limit"]
+        try:
+            # Persist paginated response for offline analysis
+            self._save_response_backup(kind, data, payload, page=page)
 
-        # Process and save jobs
-        from src.scraper.theirstack_processor import process_theirstack_jobs
+            # If API indicates truncation due to credits, stop early
+            meta_obj = data.get("metadata") or data.get("meta") or {}
+            trunc = int(meta_obj.get("truncated_results") or 0)
+            trunc_companies = int(meta_obj.get("truncated_companies") or 0)
+            if trunc or trunc_companies:
+                self.logger.warning(
+                    "[%s] API truncation: results=%d companies=%d; stopping.",
+                    label,
+                    trunc,
+                    trunc_companies,
+                )
+                return None, True
 
-        process_theirstack_jobs(collected_jobs)
+            # Extract page results
+            jobs = data.get("data", [])
+            if not jobs:
+                self.logger.info(
+                    "[%s] No more jobs returned; stopping pagination at page %d.",
+                    label,
+                    page,
+                )
+                return None, True
 
-        return collected_jobs
+            # Filter out any that may still be considered seen
+            non_english_before = counts["non_english"]
+            page_new_jobs = [job for job in jobs if keep(job)]
+            if self.english_only:
+                self.logger.info(
+                    "[%s] English filter kept %d/%d",
+                    label,
+                    len(page_new_jobs),
+                    len(page_new_jobs) + counts["non_english"] - non_english_before,
+                )
+            self.logger.info(
+                "[%s] Page %d results=%d new=%d dup=%d ids=[%s]",
+                label,
+                page,
+                len(jobs),
+                len(page_new_jobs),
+                len(jobs) - len(page_new_jobs),
+                ", ".join(str(job["id"]) for job in jobs[:5]),
+            )
+        except Exception as e:
+            self.logger.error("[%s] Error fetching jobs: %s", label, e)
+            return None, True
+
+        # If fewer than requested returned, likely end of results
+        if len(jobs) < limit:
+            self.logger.info(
+                "[%s] Last page reached at page %d (returned=%d < limit=%d).",
+                label,
+                page,
+                len(jobs),
+                limit,
+            )
+            return page_new_jobs, True
+        return page_new_jobs, False
+
+    def _persist_and_process(self, jobs: List[Dict]) -> None:
+        """Record fetched job IDs and the run date, then save jobs via the processor."""
+        self.state.add_job_ids(str(job["id"]) for job in jobs)
+        self.state.update_last_run()
+        self.state.save_state()
+        process_theirstack_jobs(jobs)
 
 
 def main():
-    # Check if already ran today
-    state = TheirStackState()
+    # Check if already ran today. A run saves the state file, so one last
+    # modified before today cannot record today's run and need not be parsed
     today = datetime.now().strftime("%Y-%m-%d")
-    if state.get_last_run_date() == today:
+    modified = TheirStackState.modified_date()
+    if (
+        modified is not None
+        and modified >= today
+        and TheirStackState().get_last_run_date() == today
+    ):
         print(f"TheirStack scraper already ran today ({today}). Skipping.")
         return
 
     try:
         print("🚀 Starting TheirStack scraper...")
-        scraper = TheirStackScraper()
-
-        print("🔍 Checking for new jobs...")
-        new_jobs = scraper.get_new_jobs()
+        with TheirStackScraper() as scraper:
+            print("🔍 Checking for new jobs...")
+            new_jobs = scraper.get_new_jobs()
 
         if new_jobs:
             print(f"✅ Found {len(new_jobs)} new jobs")
 
             # Process and save jobs to CSV
-            from src.scraper.theirstack_processor import process_theirstack_jobs
-
             df = process_theirstack_jobs(new_jobs)
 
             print("\n📊 Job Summary:")
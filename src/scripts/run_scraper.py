@@ -9,21 +9,18 @@ import time
 import logging
 import argparse
 from pathlib import Path
-from typing import Optional, Dict, Any
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, List
 
 # Add src to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # flake8: noqa: E402
-from src.scraper.amazon_scraper import AmazonJobsScraper  # type: ignore
-from src.scraper.theirstack_scraper import TheirStackScraper  # type: ignore
+# Scrapers and the dashboard pipeline pull in pandas/requests/selenium, so they
+# are imported where used; --help and single-source runs skip the rest
 from src.scraper.config import ScraperConfig  # type: ignore
 from src.utils.logging_utils import setup_logging  # type: ignore
-from src.utils.health_check import check_scraper_health  # type: ignore
 from src.utils.monitoring import ScraperMetrics  # type: ignore
-from src.utils.data_processor import process_latest_data  # type: ignore
-from src.utils.combine_jobs import update_dashboard_data  # type: ignore
 
 
 def run_amazon_scraper(config: ScraperConfig) -> Dict[str, Any]:
@@ -41,6 +38,8 @@ def run_amazon_scraper(config: ScraperConfig) -> Dict[str, Any]:
     }
 
     try:
+        from src.scraper.amazon_scraper import AmazonJobsScraper  # type: ignore
+
         scraper = AmazonJobsScraper(config)
         result_df = scraper.run()
 
@@ -79,14 +78,12 @@ def run_theirstack_scraper(config: ScraperConfig) -> Dict[str, Any]:
     }
 
     try:
-        from src.utils.theirstack_state import TheirStackState
-
-        # Initialize scraper with state management and YAML config
-        state = TheirStackState()
-        scraper = TheirStackScraper(config)
+        from src.scraper.theirstack_scraper import TheirStackScraper  # type: ignore
 
-        # Get new jobs (the scraper will process and persist via processor)
-        jobs = scraper.get_new_jobs()
+        # The scraper loads its own state and persists it via the processor
+        with TheirStackScraper(config) as scraper:
+            # Get new jobs (the scraper will process and persist via processor)
+            jobs = scraper.get_new_jobs()
 
         metrics.update(
             {
@@ -134,6 +131,8 @@ def main():
     args = parser.parse_args()
 
     # Load environment variables from .env for local runs
+    from dotenv import load_dotenv
+
     load_dotenv()
 
     # Load config and setup logging from config
@@ -161,10 +160,9 @@ def main():
     # Run the requested scrapers
     try:
         # Config already loaded above to configure logging; reuse instance
-        # config = ScraperConfig()
-
+        runners: List[Callable[[ScraperConfig], Dict[str, Any]]] = []
         if args.source in ["all", "amazon"]:
-            results.append(run_amazon_scraper(config))
+            runners.append(run_amazon_scraper)
 
         if args.source in ["all", "theirstack"]:
             ts_key = os.getenv("THEIR_STACK_API_KEY")
@@ -176,10 +174,24 @@ def main():
                 else:
                     logger.warning(msg)
             else:
-                results.append(run_theirstack_scraper(config))
+                runners.append(run_theirstack_scraper)
+
+        # Both scrapers are network-bound and independent, so overlap them;
+        # log records carry the scraper's logger name to tell them apart
+        if len(runners) > 1:
+            with ThreadPoolExecutor(
+                max_workers=len(runners), thread_name_prefix="scraper"
+            ) as executor:
+                futures = [executor.submit(runner, config) for runner in runners]
+                results.extend(future.result() for future in futures)
+        else:
+            results.extend(runner(config) for runner in runners)
 
         # Combine latest raw files, then generate dashboard if not skipped
         if not args.skip_dashboard:
+            from src.utils.combine_jobs import update_dashboard_data  # type: ignore
+            from src.utils.data_processor import process_latest_data  # type: ignore
+
             logger.info("🔄 Combining latest job files...")
             combined_path = update_dashboard_data()
             if combined_path:
@@ -2,7 +2,15 @@
 Utility functions for Amazon Jobs Scraper
 """
 
-from .health_check import check_scraper_health
 from .logging_utils import setup_logging
 
 __all__ = ["check_scraper_health", "setup_logging"]
+
+
+def __getattr__(name):
+    # The health check pulls in pandas, so import it on first access only
+    if name == "check_scraper_health":
+        from .health_check import check_scraper_health
+
+        return check_scraper_health
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
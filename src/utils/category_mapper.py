@@ -1,9 +1,15 @@
 import logging
 import re
-from typing import Dict, List, Any, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, Tuple
 
 import yaml
 
+try:  # Optional speedup: scan each field once for every category's keywords
+    import ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover - depends on installed extras
+    ahocorasick = None
+
 
 LOGGER = logging.getLogger(__name__)
 
@@ -21,6 +27,11 @@ CANONICAL_CATEGORIES: List[str] = [
     "Other",
 ]
 
+# Categories that can be scored; "Other" is only the below-threshold fallback
+_SCORED_CATEGORIES: Tuple[str, ...] = tuple(
+    cat for cat in CANONICAL_CATEGORIES if cat != "Other"
+)
+
 
 def _load_yaml_mapping() -> Dict[str, Any]:
     """Load keyword/slug mapping from YAML. Falls back to defaults if missing."""
@@ -220,55 +231,236 @@ _RULES: Dict[str, Any] = _MAPPING.get("rules", {})
 _WEIGHTS: Dict[str, float] = _MAPPING.get("weights", {})
 _TIE: Dict[str, bool] = _MAPPING.get("tie_breakers", {})
 _MIN_SCORE: float = float(_MAPPING.get("min_score", 1.0))
+# Optional fast path: first two title words -> category, bypassing scoring
+_TITLE_PREFIXES: Dict[str, str] = {
+    " ".join(str(prefix).lower().split()[:2]): category
+    for prefix, category in (_MAPPING.get("title_prefixes") or {}).items()
+    if category in CANONICAL_CATEGORIES
+}
 
 
 def _tokenize(text: str) -> str:
     return (text or "").lower()
 
 
-def _count_keyword_hits(text: str, keywords: List[str]) -> int:
-    if not text or not keywords:
-        return 0
-    t = text
-    hits = 0
-    for kw in keywords:
+# A keyword matcher: the raw keyword plus, for keywords padded with spaces
+# (e.g. "ai "), a whole-word test for its stripped form
+_KeywordMatcher = Tuple[str, Optional[Callable[[str], bool]]]
+
+_is_word_char = re.compile(r"\w").match
+
+
+def _whole_word_finder(word: str) -> Callable[[str], bool]:
+    """Return a test equivalent to ``re.search(r"\\b<word>\\b", text)``.
+
+    Short keywords like "ai" are also common inside longer words, which makes
+    the regex scan slow; this walks str.find() hits and only checks the
+    characters around each one.
+    """
+    if not word:
+        return re.compile(r"\b\b").search  # type: ignore[return-value]
+    size = len(word)
+    # At a \b the word-ness of the neighbour differs from the keyword's own edge
+    first_is_word = bool(_is_word_char(word[0]))
+    last_is_word = bool(_is_word_char(word[-1]))
+
+    def contains(text: str) -> bool:
+        find = text.find
+        pos = find(word)
+        while pos != -1:
+            end = pos + size
+            if (pos > 0 and bool(_is_word_char(text[pos - 1]))) != first_is_word and (
+                end < len(text) and bool(_is_word_char(text[end]))
+            ) != last_is_word:
+                return True
+            pos = find(word, pos + 1)
+        return False
+
+    return contains
+
+
+def _compile_keywords(keywords: List[str]) -> Tuple[_KeywordMatcher, ...]:
+    """Pre-build the matchers used by _count_keyword_hits for one keyword list.
+
+    A keyword hits on a plain substring match or on a whole-word match of its
+    stripped form. The whole-word test can only add hits when the keyword has
+    surrounding spaces, so only those keywords get one.
+    """
+    matchers: List[_KeywordMatcher] = []
+    for kw in keywords or []:
         if not kw:
             continue
-        if re.search(r"\b" + re.escape(kw.strip()) + r"\b", t):
-            hits += 1
-        elif kw in t:
-            # fallback substring
+        stripped = kw.strip()
+        whole_word = _whole_word_finder(stripped) if stripped != kw else None
+        matchers.append((kw, whole_word))
+    return tuple(matchers)
+
+
+# Title keyword matchers per category, compiled once at import
+_TITLE_MATCHERS: Dict[str, Tuple[_KeywordMatcher, ...]] = {
+    cat: _compile_keywords((rule or {}).get("title", [])) for cat, rule in _RULES.items()
+}
+# Lowercased technology slugs per category, for a single set intersection per job
+_TECH_SLUG_SETS: Dict[str, FrozenSet[str]] = {
+    cat: frozenset(s.lower() for s in ((rule or {}).get("tech_slugs") or []))
+    for cat, rule in _RULES.items()
+}
+_SOLUTIONS_ARCHITECT_RE = re.compile(r"\bsolutions? architect\b")
+_SECURITY_RE = re.compile(r"\bsecurity\b")
+
+
+def _count_keyword_hits(text: str, matchers: Tuple[_KeywordMatcher, ...]) -> int:
+    """Count how many distinct keywords occur in ``text`` (see _compile_keywords)."""
+    if not text or not matchers:
+        return 0
+    hits = 0
+    for kw, whole_word in matchers:
+        # Cheap C-level substring test first; padded keywords also try whole words
+        if kw in text or (whole_word is not None and whole_word(text)):
             hits += 1
     return hits
 
 
-def _score_category(cat: str, job: Dict[str, Any]) -> float:
-    rule = _RULES.get(cat, {}) or {}
-    score = 0.0
+def _build_keyword_automaton() -> Any:
+    """Aho-Corasick automaton over every category's title keywords, if available.
 
-    title = _tokenize(job.get("job_title", ""))
-    ntitle = _tokenize(job.get("normalized_title", job.get("job_title", "")))
-    desc = _tokenize(job.get("description", ""))
-    slugs: List[str] = [s.lower() for s in job.get("technology_slugs", []) or []]
+    Each keyword maps to ``(keyword, categories)``; a keyword listed under several
+    categories (or twice in one) counts once per listing, as in _count_keyword_hits.
+    """
+    if ahocorasick is None:
+        return None
+    owners: Dict[str, List[str]] = {}
+    for cat, matchers in _TITLE_MATCHERS.items():
+        for kw, _ in matchers:
+            owners.setdefault(kw, []).append(cat)
+    if not owners:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw, cats in owners.items():
+        automaton.add_word(kw, (kw, tuple(cats)))
+    automaton.make_automaton()
+    return automaton
 
-    score += _WEIGHTS.get("title", 1.0) * _count_keyword_hits(
-        title, rule.get("title", [])
-    )
-    score += _WEIGHTS.get("normalized_title", 1.0) * _count_keyword_hits(
-        ntitle, rule.get("title", [])
-    )
 
-    if slugs and rule.get("tech_slugs"):
-        slug_hits = len(
-            set(slugs) & set([s.lower() for s in rule.get("tech_slugs", [])])
-        )
-        score += _WEIGHTS.get("tech_slugs", 0.8) * slug_hits
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
 
-    score += _WEIGHTS.get("description", 0.4) * _count_keyword_hits(
-        desc, rule.get("title", [])
-    )
 
-    return score
+def _max_description_gain() -> Dict[str, float]:
+    """Most the description can add to each category's final score.
+
+    Every distinct title keyword found in the description adds the description
+    weight, and a description hit can also newly enable the ML/BI tie-breaker
+    bonus; no other step depends on the description.
+    """
+    desc_weight = _WEIGHTS.get("description", 0.4)
+    gain = {
+        cat: desc_weight * len(_TITLE_MATCHERS.get(cat, ()))
+        for cat in _SCORED_CATEGORIES
+    }
+    if _TIE.get("ml_over_data_science") and "Machine Learning Science" in gain:
+        gain["Machine Learning Science"] += 0.5
+    if _TIE.get("bi_over_data_science") and "Business Intelligence" in gain:
+        gain["Business Intelligence"] += 0.5
+    return gain
+
+
+_DESC_MAX_GAIN: Dict[str, float] = _max_description_gain()
+# Padded keywords whose whole-word form must still be checked when the raw
+# (space-padded) keyword is not a substring
+_PADDED_KEYWORDS: Tuple[Tuple[str, str, Callable[[str], bool]], ...] = tuple(
+    (cat, kw, whole_word)
+    for cat, matchers in _TITLE_MATCHERS.items()
+    for kw, whole_word in matchers
+    if whole_word is not None
+)
+
+
+def _category_hits(text: str) -> Dict[str, int]:
+    """Distinct title-keyword hits in ``text`` for every category.
+
+    With pyahocorasick installed the text is scanned once for all categories;
+    otherwise each category's matchers are tried in turn.
+    """
+    if not text:
+        return {}
+    if _KEYWORD_AUTOMATON is None:
+        return {
+            cat: _count_keyword_hits(text, matchers)
+            for cat, matchers in _TITLE_MATCHERS.items()
+        }
+    found: Dict[str, Tuple[str, ...]] = {}
+    for _, (kw, cats) in _KEYWORD_AUTOMATON.iter(text):
+        found[kw] = cats
+    counts: Dict[str, int] = {}
+    for cats in found.values():
+        for cat in cats:
+            counts[cat] = counts.get(cat, 0) + 1
+    for cat, kw, whole_word in _PADDED_KEYWORDS:
+        if kw not in found and whole_word(text):
+            counts[cat] = counts.get(cat, 0) + 1
+    return counts
+
+
+def _score_all(title: str, ntitle: str, slugs: FrozenSet[str]) -> Dict[str, float]:
+    """Score every category from the job's titles and slug set (no description)."""
+    title_hits = _category_hits(title)
+    ntitle_hits = _category_hits(ntitle)
+    title_weight = _WEIGHTS.get("title", 1.0)
+    ntitle_weight = _WEIGHTS.get("normalized_title", 1.0)
+    tech_weight = _WEIGHTS.get("tech_slugs", 0.8)
+
+    scores: Dict[str, float] = {}
+    for cat in _SCORED_CATEGORIES:
+        score = 0.0
+        score += title_weight * title_hits.get(cat, 0)
+        score += ntitle_weight * ntitle_hits.get(cat, 0)
+        tech = _TECH_SLUG_SETS.get(cat)
+        if slugs and tech:
+            score += tech_weight * len(tech.intersection(slugs))
+        scores[cat] = score
+    return scores
+
+
+@lru_cache(maxsize=4096)
+def _classify_titles(
+    title: str, ntitle: str, title_all: str, slugs: FrozenSet[str]
+) -> Tuple[Optional[str], Tuple[float, ...], bool]:
+    """Everything infer_job_category derives from titles and slugs alone.
+
+    Recurring postings share titles and slugs across a scrape and across runs,
+    so this is memoized; the description is still scored per job. Call
+    ``_classify_titles.cache_clear()`` after changing the module-level rules.
+
+    Returns:
+        A category decided by an override or title prefix (else None), the
+        title/slug scores in _SCORED_CATEGORIES order, and whether the title
+        reads as a PM/TPM role.
+    """
+    # Plain substring checks rule out most titles before the word-boundary regexes
+    if (
+        _TIE.get("solutions_architect_override")
+        and "architect" in title_all
+        and _SOLUTIONS_ARCHITECT_RE.search(title_all)
+    ):
+        return "Solutions Architect", (), False
+    if (
+        _TIE.get("security_override")
+        and "security" in title_all
+        and _SECURITY_RE.search(title_all)
+    ):
+        return "Security", (), False
+
+    if _TITLE_PREFIXES:
+        category = _TITLE_PREFIXES.get(" ".join(title.split()[:2]))
+        if category:
+            return category, (), False
+
+    scores = _score_all(title, ntitle, slugs)
+    pm_hits = _count_keyword_hits(
+        title_all,
+        _TITLE_MATCHERS.get("Project/Program/Product Management--Technical", ()),
+    )
+    return None, tuple(scores.values()), pm_hits > 0
 
 
 def infer_job_category(job: Dict[str, Any]) -> str:
@@ -279,30 +471,61 @@ def infer_job_category(job: Dict[str, Any]) -> str:
     Returns:
         Category string from CANONICAL_CATEGORIES
     """
-    # First, early overrides for very specific roles
-    title_all = " ".join(
-        [
-            _tokenize(job.get("job_title", "")),
-            _tokenize(job.get("normalized_title", "")),
-        ]
+    # Normalize fields once; every category below scores the same values
+    title = _tokenize(job.get("job_title", ""))
+    if "normalized_title" in job:
+        ntitle = _tokenize(job["normalized_title"])
+        title_all = " ".join([title, ntitle])
+    else:
+        # Without a normalized title the job title stands in; reuse its lowercasing
+        ntitle = title
+        title_all = title + " "
+    slugs = frozenset(s.lower() for s in job.get("technology_slugs", []) or [])
+
+    # Overrides, title prefixes and title/slug scores for all categories but Other
+    decided, scores, pm_title = _classify_titles(title, ntitle, title_all, slugs)
+    if decided:
+        return decided
+    score_dict = dict(zip(_SCORED_CATEGORIES, scores))
+
+    # The description is by far the longest field and only a weak signal: skip
+    # it when no amount of description hits could change the titles/slugs result
+    desc_weight = _WEIGHTS.get("description", 0.4)
+    if desc_weight > 0:
+        title_only = _pick_category(dict(score_dict), pm_title)
+        if not _description_could_change(title_only):
+            return title_only[0]
+        desc_hits = _category_hits(_tokenize(job.get("description", "")))
+        for cat in score_dict:
+            score_dict[cat] += desc_weight * desc_hits.get(cat, 0)
+
+    return _pick_category(score_dict, pm_title)[0]
+
+
+def _description_could_change(picked: Tuple[str, float, Dict[str, float]]) -> bool:
+    """True unless the pick beats every rival even at its largest description gain.
+
+    Description hits only raise scores, so a winner at or above min_score stays
+    above it; only a rival overtaking (or tying) it could change the result.
+    """
+    best_cat, best_score, final = picked
+    if best_score < _MIN_SCORE:
+        return True
+    return any(
+        score + _DESC_MAX_GAIN.get(cat, 0.0) >= best_score
+        for cat, score in final.items()
+        if cat != best_cat
     )
 
-    if _TIE.get("solutions_architect_override") and re.search(
-        r"\bsolutions? architect\b", title_all
-    ):
-        return "Solutions Architect"
-    if _TIE.get("security_override") and re.search(r"\bsecurity\b", title_all):
-        return "Security"
-
-    # Score all categories except Other
-    scores: List[Tuple[str, float]] = []
-    for cat in CANONICAL_CATEGORIES:
-        if cat == "Other":
-            continue
-        scores.append((cat, _score_category(cat, job)))
 
+def _pick_category(
+    score_dict: Dict[str, float], pm_title: bool
+) -> Tuple[str, float, Dict[str, float]]:
+    """Apply the tie-breakers to ``score_dict`` (in place) and pick the category.
+
+    Returns the chosen category, its score and the adjusted scores.
+    """
     # Tie-break adjustments
-    score_dict: Dict[str, float] = dict(scores)
     if (
         _TIE.get("ml_over_data_science")
         and score_dict.get("Machine Learning Science", 0) > 0
@@ -317,13 +540,7 @@ def infer_job_category(job: Dict[str, Any]) -> str:
         score_dict["Business Intelligence"] += 0.5
 
     # If role clearly PM/TPM, keep it there (do not promote/demote by seniority)
-    pm_hits = _count_keyword_hits(
-        title_all,
-        _RULES.get("Project/Program/Product Management--Technical", {}).get(
-            "title", []
-        ),
-    )
-    if pm_hits > 0:
+    if pm_title:
         score_dict["Project/Program/Product Management--Technical"] += 0.5
 
     # Pick best
@@ -331,5 +548,28 @@ def infer_job_category(job: Dict[str, Any]) -> str:
         max(score_dict.items(), key=lambda x: x[1]) if score_dict else ("Other", 0.0)
     )
     if best_score < _MIN_SCORE:
-        return "Other"
-    return best_cat
+        return "Other", best_score, score_dict
+    return best_cat, best_score, score_dict
+
+
+def infer_job_categories_batch(jobs: List[Dict[str, Any]]) -> List[str]:
+    """Infer categories for a batch of jobs, in input order.
+
+    Postings repeated across locations usually share title, description and
+    slugs, so each distinct combination is classified only once per batch.
+    """
+    results: List[str] = []
+    seen: Dict[Tuple[Any, ...], str] = {}
+    for job in jobs:
+        key = (
+            job.get("job_title", ""),
+            job.get("normalized_title"),
+            "normalized_title" in job,
+            job.get("description", ""),
+            tuple(job.get("technology_slugs", []) or []),
+        )
+        category = seen.get(key)
+        if category is None:
+            category = seen[key] = infer_job_category(job)
+        results.append(category)
+    return results
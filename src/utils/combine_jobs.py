@@ -5,16 +5,39 @@ This module provides functionality to combine job listings from different source
 (Amazon, TheirStack, etc.) into a single CSV file that can be used by the dashboard.
 """
 
+import hashlib
+import json
+import os
 import pandas as pd
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from src.scraper.config import ScraperConfig  # type: ignore
 from src.utils.paths import (
     get_raw_path,
     get_combined_file,
     get_raw_dir,
 )  # type: ignore
+from src.utils.raw_storage import (
+    coerce_active,
+    read_jobs_table,
+    write_jobs_table,
+)  # type: ignore
+
+try:  # Optional speedup: pyarrow parses and writes CSV in C on several threads
+    import pyarrow as pa  # type: ignore
+    from pyarrow import csv as pa_csv  # type: ignore
+except ImportError:  # pragma: no cover - depends on installed extras
+    pa = pa_csv = None
+
+# C parser (used without pyarrow): map the file instead of buffered reads, and
+# infer each column's dtype from the whole file in one pass rather than per chunk
+_CSV_OPTIONS: Dict[str, object] = {
+    "engine": "c",
+    "memory_map": True,
+    "low_memory": False,
+}
 
 # Set up logging
 logging.basicConfig(
@@ -22,6 +45,93 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Columns of the combined file, in order
+COMBINED_COLUMNS = [
+    "id",
+    "title",
+    "company",
+    "location",
+    "posting_date",
+    "url",
+    "description",
+    "basic_qual",
+    "pref_qual",
+    "skills",
+    "active",
+    "job_category",  # Renamed from 'category'
+    "team",
+    "role",
+    "source",
+]
+# Columns worth loading from a source file: the combined ones plus legacy names
+# they are derived from; parsed extras (about, responsibilities, ...) are skipped
+_SOURCE_COLUMNS = frozenset(COMBINED_COLUMNS) | {"job_url", "category"}
+# Upper bound on source files read concurrently
+_MAX_READ_WORKERS = 4
+# Low-cardinality text columns, kept as categoricals while combining
+_CATEGORY_COLUMNS = ("company", "job_category", "team", "role", "source")
+# Code the combined file is built with; a change to any of it invalidates the
+# manifest so an upgrade rebuilds the output even when no source was rewritten
+_COMBINE_INPUTS = (
+    Path(__file__).with_name("combine_jobs.py"),
+    Path(__file__).with_name("raw_storage.py"),
+)
+
+
+def _concat_jobs(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate per-source frames with low-cardinality columns as categoricals.
+
+    pd.concat only keeps a categorical column when every frame has identical
+    categories (otherwise it falls back to object), so each such column is
+    first given the union of all frames' categories.
+    """
+    # Header-only sources add no rows but still take part in the dtype
+    # reconciliation; keep one frame if all are empty so the columns survive
+    frames = [df for df in frames if len(df)] or frames[:1]
+    for col in _CATEGORY_COLUMNS:
+        parts = [df for df in frames if col in df.columns]
+        if not parts:
+            continue
+        for df in parts:
+            df[col] = df[col].astype("category")
+        categories = parts[0][col].cat.categories
+        for df in parts[1:]:
+            categories = categories.union(df[col].cat.categories, sort=False)
+        dtype = pd.CategoricalDtype(categories)
+        for df in parts:
+            df[col] = df[col].astype(dtype)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _files_in(directory: Path) -> Optional[Set[str]]:
+    """Names of the regular files in directory from one scan, or None if unreadable."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return None
+
+
+def _write_combined(df: pd.DataFrame, path: Path) -> None:
+    """Write the combined table; CSV output goes through Arrow's writer if available."""
+    if pa_csv is None or path.suffix.lower() in (".parquet", ".feather"):
+        write_jobs_table(df, path)
+        return
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        # e.g. an object column mixing strings and dates; pandas writes any mix
+        logger.warning(f"Arrow cannot convert the combined table ({e}); using to_csv")
+        write_jobs_table(df, path)
+        return
+    # Categorical columns arrive as dictionaries; write their plain values
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            table = table.set_column(
+                i, field.name, table.column(i).cast(field.type.value_type)
+            )
+    pa_csv.write_csv(table, path)
+
 
 def get_latest_job_files(data_dir: Optional[Path] = None) -> List[Path]:
     """
@@ -49,9 +159,15 @@ def get_latest_job_files(data_dir: Optional[Path] = None) -> List[Path]:
         raw_map: Dict[str, str] = cfg.get("output.raw_filenames", {}) or {}
         source_names = sorted(list(raw_map.keys()))
 
+    # One directory scan per parent instead of a stat() per source
+    listings: Dict[Path, Optional[Set[str]]] = {}
     for source in sorted(source_names):
         path = get_raw_path(source, cfg)
-        if path.exists():
+        if path.parent not in listings:
+            listings[path.parent] = _files_in(path.parent)
+        present = listings[path.parent]
+        found = path.exists() if present is None else path.name in present
+        if found:
             job_files.append(path)
         else:
             logger.warning(f"No raw file found for source '{source}' at {path}")
@@ -60,14 +176,122 @@ def get_latest_job_files(data_dir: Optional[Path] = None) -> List[Path]:
     if not job_files:
         data_path = Path(data_dir) if data_dir is not None else get_raw_dir(cfg)
         if data_path.exists():
-            for file in data_path.glob("*_jobs.csv"):
-                job_files.append(file)
+            for pattern in ("*_jobs.csv", "*_jobs.parquet", "*_jobs.feather"):
+                job_files.extend(data_path.glob(pattern))
         else:
             logger.error(f"Data directory not found: {data_path}")
 
     return job_files
 
 
+def _read_source_csv(file: Path) -> pd.DataFrame:
+    """Read a source CSV with Arrow, keeping every column as the text in the file.
+
+    Arrow would otherwise infer date types for ISO posting dates while leaving
+    free-text dates as strings; reading text keeps the column uniform, as the
+    C parser does. Empty and NA-like cells still come back as missing values.
+    """
+    header = pd.read_csv(file, nrows=0).columns
+    columns = [c for c in header if c in _SOURCE_COLUMNS]
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=columns,
+        column_types={c: pa.string() for c in columns},
+        strings_can_be_null=True,
+    )
+    # Descriptions and qualifications are quoted multi-line values; without this
+    # Arrow splits blocks mid-record once a file spans more than one block
+    parse_options = pa_csv.ParseOptions(newlines_in_values=True)
+    return pa_csv.read_csv(
+        file, parse_options=parse_options, convert_options=convert_options
+    ).to_pandas()
+
+
+def _load_job_file(file: Path) -> Optional[pd.DataFrame]:
+    """Read one source file and normalize it for combining; None if unreadable."""
+    try:
+        if pa_csv is not None and file.suffix.lower() not in (".parquet", ".feather"):
+            df = _read_source_csv(file)
+        else:
+            df = read_jobs_table(file, columns=_SOURCE_COLUMNS, **_CSV_OPTIONS)
+
+        # Normalize known legacy/mismatched columns
+        if "url" not in df.columns and "job_url" in df.columns:
+            df["url"] = df["job_url"]
+        if "job_category" not in df.columns and "category" in df.columns:
+            df = df.rename(columns={"category": "job_category"})
+
+        # Ensure 'active' exists and is boolean; default to True if missing/empty
+        if "active" not in df.columns:
+            df["active"] = True
+        else:
+            df["active"] = coerce_active(df["active"])
+
+        # Ensure required columns exist
+        if "source" not in df.columns:
+            # Infer source from filename as last resort
+            stem = file.stem.lower()
+            if stem.startswith("amazon"):
+                df["source"] = "Amazon"
+            elif stem.startswith("theirstack"):
+                df["source"] = "TheirStack"
+            else:
+                df["source"] = "unknown"
+
+        logger.info(f"Loaded {len(df)} jobs from {file.name}")
+        return df
+
+    except Exception as e:
+        logger.error(f"Error reading {file}: {e}")
+        return None
+
+
+def _manifest_path(output_file: Path) -> Path:
+    return output_file.with_name(output_file.name + ".manifest.json")
+
+
+def _file_signature(files: List[Path]) -> List[List]:
+    """(path, size, mtime_ns) for each file; any rewrite of a file changes it."""
+    signature = []
+    for file in files:
+        st = os.stat(file)
+        signature.append([str(file), st.st_size, st.st_mtime_ns])
+    return signature
+
+
+def _combine_version() -> str:
+    """Hash of the code and CSV writer the combined file is built with."""
+    digest = hashlib.sha256()
+    # Arrow's CSV writer quotes every text field and writes true/false, so
+    # installing or removing pyarrow changes the output format as well
+    digest.update(b"arrow" if pa_csv is not None else b"pandas")
+    for path in _COMBINE_INPUTS:
+        digest.update(path.name.encode("utf-8"))
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def _combined_up_to_date(
+    output_file: Path,
+    manifest_file: Path,
+    source_signature: List[List],
+    version: str,
+) -> bool:
+    """True if the last combine's manifest matches the sources, code and output."""
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        return (
+            manifest["sources"] == source_signature
+            and manifest["version"] == version
+            and manifest["output"] == _file_signature([output_file])
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
 def combine_job_files(
     files: List[Path], output_dir: str = "data/processed"
 ) -> Optional[Path]:
@@ -85,126 +309,67 @@ def combine_job_files(
         logger.warning("No job files to combine")
         return None
 
-    all_jobs = []
-
-    for file in files:
-        try:
-            df = pd.read_csv(file)
-
-            # Normalize known legacy/mismatched columns
-            if "url" not in df.columns and "job_url" in df.columns:
-                df["url"] = df["job_url"]
-            if "job_category" not in df.columns and "category" in df.columns:
-                df = df.rename(columns={"category": "job_category"})
-
-            # Ensure 'active' exists and is boolean; default to True if missing/empty
-            if "active" not in df.columns:
-                df["active"] = True
-            else:
-                # Coerce common truthy/falsey representations; treat NaN/empty as True (currently scraped jobs)
-                coerced = (
-                    df["active"]
-                    .astype(str)
-                    .str.strip()
-                    .str.lower()
-                    .map(
-                        {
-                            "true": True,
-                            "t": True,
-                            "1": True,
-                            "yes": True,
-                            "y": True,
-                            "false": False,
-                            "f": False,
-                            "0": False,
-                            "no": False,
-                            "n": False,
-                        }
-                    )
-                )
-                df["active"] = coerced.fillna(True)
-
-            # Ensure required columns exist
-            if "source" not in df.columns:
-                # Infer source from filename as last resort
-                stem = file.stem.lower()
-                if stem.startswith("amazon"):
-                    df["source"] = "Amazon"
-                elif stem.startswith("theirstack"):
-                    df["source"] = "TheirStack"
-                else:
-                    df["source"] = "unknown"
-
-            all_jobs.append(df)
-            logger.info(f"Loaded {len(df)} jobs from {file.name}")
-
-        except Exception as e:
-            logger.error(f"Error reading {file}: {e}")
+    # Determine configured combined file path
+    cfg = ScraperConfig()
+    output_file = get_combined_file(cfg)
+    manifest_file = _manifest_path(output_file)
+
+    # Skip the rewrite when neither the sources nor the previous output
+    # changed since the last combine (raw files are rewritten in place with
+    # updated 'active' flags, so there is no append-only delta to apply)
+    try:
+        source_signature: Optional[List[List]] = _file_signature(files)
+    except OSError:
+        source_signature = None
+    version = _combine_version()
+    if source_signature is not None and _combined_up_to_date(
+        output_file, manifest_file, source_signature, version
+    ):
+        logger.info(f"Sources unchanged; keeping {output_file}")
+        return output_file
+
+    # Sources are independent and pandas' parser releases the GIL, so
+    # read them in parallel; map() keeps the input order for the concat
+    if len(files) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_READ_WORKERS, len(files)),
+            thread_name_prefix="combine",
+        ) as executor:
+            loaded = list(executor.map(_load_job_file, files))
+    else:
+        loaded = [_load_job_file(file) for file in files]
+    all_jobs = [df for df in loaded if df is not None]
 
     if not all_jobs:
         logger.error("No valid job data found")
         return None
 
     # Combine all DataFrames
-    combined_df = pd.concat(all_jobs, ignore_index=True)
-
-    # Ensure consistent column order
-    columns = [
-        "id",
-        "title",
-        "company",
-        "location",
-        "posting_date",
-        "url",
-        "description",
-        "basic_qual",
-        "pref_qual",
-        "skills",
-        "active",
-        "job_category",  # Renamed from 'category'
-        "team",
-        "role",
-        "source",
-    ]
-
-    # Add any missing columns with empty values
-    for col in columns:
-        if col not in combined_df.columns:
-            combined_df[col] = True if col == "active" else ""
-
-    # Reorder columns
-    combined_df = combined_df[columns]
-
-    # Final safety: ensure 'active' is boolean dtype
-    if "active" in combined_df.columns:
-        combined_df["active"] = (
-            combined_df["active"]
-            .astype(str)
-            .str.strip()
-            .str.lower()
-            .map(
-                {
-                    "true": True,
-                    "t": True,
-                    "1": True,
-                    "yes": True,
-                    "y": True,
-                    "false": False,
-                    "f": False,
-                    "0": False,
-                    "no": False,
-                    "n": False,
-                }
-            )
-            .fillna(True)
-            .astype(bool)
-        )
+    combined_df = _concat_jobs(all_jobs)
+
+    # Consistent column order in one reindex; columns no source provided are
+    # filled with empty values ('active' is always present, see _load_job_file)
+    combined_df = combined_df.reindex(columns=COMBINED_COLUMNS, fill_value="")
+
+    # Every source frame already carries a bool 'active', so the concat is
+    # bool too; the cast only pins the dtype without re-normalizing values
+    combined_df["active"] = combined_df["active"].astype(bool, copy=False)
 
-    # Determine configured combined file path
-    cfg = ScraperConfig()
-    output_file = get_combined_file(cfg)
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    combined_df.to_csv(output_file, index=False)
+    _write_combined(combined_df, output_file)
+    if source_signature is not None:
+        try:
+            with open(manifest_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "sources": source_signature,
+                        "version": version,
+                        "output": _file_signature([output_file]),
+                    },
+                    f,
+                )
+        except OSError as e:
+            logger.warning(f"Could not write combine manifest {manifest_file}: {e}")
 
     logger.info(
         f"Combined {len(combined_df)} jobs from {len(files)} sources into {output_file}"
@@ -3,63 +3,19 @@ HTML template for the Jobs dashboard.
 Separated from data_processor.py for better modularity.
 """
 
-from typing import List
+import io
+from typing import Iterable, List, TextIO
 from html import escape
 
+import numpy as np
 
-def generate_dashboard_html_template(
-    total_jobs: int,
-    active_jobs: int,
-    last_updated: str,
-    table_rows: str,
-    job_categories: list,
-    roles: list,
-    teams: list,
-    skills_data: dict,
-    category_job_counts: dict,
-    jobs_data: list,
-) -> str:
-    """
-    Generates the static HTML dashboard template with dynamic data injected.
-
-    Args:
-        total_jobs: Total number of jobs.
-        active_jobs: Number of active jobs.
-        last_updated: Timestamp of the last update.
-        table_rows: HTML string containing all the <tr> table rows.
-        job_categories: A list of unique job categories for the filter dropdown.
-        roles: A list of unique roles for the filter dropdown.
-        teams: A list of unique teams for the filter dropdown.
-        skills_data: A dictionary mapping job categories to a list of their top skills.
-        category_job_counts: A dictionary with the total job count for each category.
-
-    Returns:
-        A complete HTML string for the dashboard.
-    """
-    category_options = "".join(
-        [
-            f'<option value="{escape(str(cat), quote=True)}">{escape(str(cat))}</option>'
-            for cat in job_categories
-        ]
-    )
-    # role_options = "".join([f'<option value="{r}">{r}</option>' for r in roles])
-    # team_options = "".join([f'<option value="{t}">{t}</option>' for t in teams])
-
-    # Convert skills_data, category_job_counts, and jobs_data to JSON for JavaScript
-    import json
+from src.utils.json_compat import json_dumps  # type: ignore
 
-    # Escape closing tags to prevent </script> breaking out of the script block
-    skills_data_json = json.dumps(skills_data).replace("</", "<\\/")
-    category_job_counts_json = json.dumps(category_job_counts).replace("</", "<\\/")
-    jobs_data_json = json.dumps(jobs_data).replace("</", "<\\/")
-
-    # Generate the initial HTML for the skills list (for all categories)
-    total_jobs_for_all = category_job_counts.get("All Categories", 0)
-    initial_skills_html = _generate_skills_html(
-        skills_data.get("All Categories", []), total_jobs_for_all
-    )
+# Filter dropdown entry; value and label are the same escaped text
+_OPTION_TMPL = '<option value="%s">%s</option>'
 
-    return f"""
+# Static document head
+_PAGE_HEAD = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -77,7 +33,10 @@ def generate_dashboard_html_template(
             <p>Personal job monitoring dashboard</p>
         </div>
 
-        <div class="stats">
+"""
+
+# Stats, filters and table header, up to the first table row
+_PAGE_BODY_TOP_FMT = """        <div class="stats">
             <div class="stat">
                 <div class="stat-number">{total_jobs}</div>
                 <div class="stat-label">Total Jobs</div>
@@ -87,7 +46,7 @@ def generate_dashboard_html_template(
                 <div class="stat-label">Active Jobs</div>
             </div>
             <div class="stat">
-                <div class="stat-number">{total_jobs - active_jobs}</div>
+                <div class="stat-number">{inactive_jobs}</div>
                 <div class="stat-label">Inactive Jobs</div>
             </div>
         </div>
@@ -127,12 +86,15 @@ def generate_dashboard_html_template(
                         <th>Title</th>
                         <th>Company</th>
                         <th>Category</th>
-                        <th id="posting-date-header" class="sortable">Posted</th>
+                        <th id="posting-date-header" class="sortable sorted-desc">Posted</th>
                         <th>Status</th>
                     </tr>
                 </thead>
                 <tbody>
-                    {table_rows}
+                    """.format
+
+# End of the table, skills and footer
+_PAGE_BODY_BOTTOM_FMT = """
                 </tbody>
             </table>
         </div>
@@ -159,57 +121,60 @@ def generate_dashboard_html_template(
         </div>
     </div>
 
-    <script>
+""".format
+
+# Data consumed by the inline script below
+_PAGE_DATA_FMT = """    <script>
         const skillsData = {skills_data_json};
         const categoryJobCounts = {category_job_counts_json};
         window.jobsData = {jobs_data_json};
-        const skillsPerPage = 10;
+""".format
+
+# Static client-side skills rendering and closing tags
+_PAGE_TAIL = """        const skillsPerPage = 10;
         let currentPage = 1;
 
-        function escapeHtml(str) {{
+        function escapeHtml(str) {
             return String(str)
                 .replace(/&/g, "&amp;")
                 .replace(/</g, "&lt;")
                 .replace(/>/g, "&gt;")
                 .replace(/"/g, "&quot;")
                 .replace(/'/g, "&#39;");
-        }}
+        }
 
-        function generateSkillsHtml(skills, totalJobs, page) {{
-            if (!skills || skills.length === 0 || totalJobs === 0) {{
+        function generateSkillsHtml(skills, totalJobs, page) {
+            if (!skills || skills.length === 0 || totalJobs === 0) {
                 return '<p>No specific skills found for this category.</p>';
-            }}
+            }
 
             const start = (page - 1) * skillsPerPage;
             const end = start + skillsPerPage;
             const skillsToDisplay = skills.slice(start, end);
 
-            let html = '<div class="skills-grid">';
-            skillsToDisplay.forEach(skill => {{
+            const items = skillsToDisplay.map(skill => {
                 const name = skill[0];
                 const safeName = escapeHtml(name);
                 const counts = skill[1];
-                const total = counts.basic_count + counts.preferred_count;
                 const basicPercentage = (counts.basic_count / totalJobs) * 100;
                 const preferredPercentage = (counts.preferred_count / totalJobs) * 100;
                 const totalPercentage = basicPercentage + preferredPercentage;
 
-                html += `
+                return `
                     <div class="skill-item">
-                        <span class="skill-name">${{safeName}}</span>
+                        <span class="skill-name">${safeName}</span>
                         <div class="skill-bar-container">
-                            <div class="skill-bar-basic" style="width: ${{basicPercentage.toFixed(1)}}%;"></div>
-                            <div class="skill-bar-preferred" style="width: ${{preferredPercentage.toFixed(1)}}%;"></div>
+                            <div class="skill-bar-basic" style="width: ${basicPercentage.toFixed(1)}%;"></div>
+                            <div class="skill-bar-preferred" style="width: ${preferredPercentage.toFixed(1)}%;"></div>
                         </div>
-                        <span class="skill-percentage">${{totalPercentage.toFixed(1)}}%</span>
+                        <span class="skill-percentage">${totalPercentage.toFixed(1)}%</span>
                     </div>
                 `;
-            }});
-            html += '</div>';
-            return html;
-        }}
+            });
+            return '<div class="skills-grid">' + items.join('') + '</div>';
+        }
 
-        function updateSkillsPagination(skills) {{
+        function updateSkillsPagination(skills) {
             const totalSkills = skills.length;
             const totalPages = Math.ceil(totalSkills / skillsPerPage);
             const paginationContainer = document.getElementById('skills-pagination');
@@ -217,15 +182,15 @@ def generate_dashboard_html_template(
             const nextButton = document.getElementById('next-page');
             const pageInfo = document.getElementById('page-info');
 
-            if (totalSkills > skillsPerPage) {{
+            if (totalSkills > skillsPerPage) {
                 paginationContainer.classList.remove('hidden');
                 prevButton.disabled = currentPage === 1;
                 nextButton.disabled = currentPage === totalPages;
-                pageInfo.textContent = `Page ${{currentPage}} of ${{totalPages}}`;
-            }} else {{
+                pageInfo.textContent = `Page ${currentPage} of ${totalPages}`;
+            } else {
                 paginationContainer.classList.add('hidden');
-            }}
-        }}
+            }
+        }
     </script>
     <script src="dashboard_interactions.js"></script>
 </body>
@@ -233,6 +198,130 @@ def generate_dashboard_html_template(
 """
 
 
+def _script_json(obj) -> str:
+    """Serialize obj as JSON for an inline <script>."""
+    text = json_dumps(obj, non_str_keys=True).decode("utf-8")
+    # Escape closing tags to prevent </script> breaking out of the script block
+    return text.replace("</", "<\\/")
+
+
+def stream_dashboard_html(
+    total_jobs: int,
+    active_jobs: int,
+    last_updated: str,
+    rows_iter: Iterable[str],
+    job_categories: list,
+    roles: list,
+    teams: list,
+    skills_data: dict,
+    category_job_counts: dict,
+    jobs_data: list,
+    out: TextIO,
+) -> None:
+    """
+    Writes the HTML dashboard to out piece by piece, without building the page in memory.
+
+    Args:
+        total_jobs: Total number of jobs.
+        active_jobs: Number of active jobs.
+        last_updated: Timestamp of the last update.
+        rows_iter: Iterable of HTML <tr> table rows, consumed once as the table is written.
+        job_categories: A list of unique job categories for the filter dropdown.
+        roles: A list of unique roles for the filter dropdown.
+        teams: A list of unique teams for the filter dropdown.
+        skills_data: A dictionary mapping job categories to a list of their top skills.
+        category_job_counts: A dictionary with the total job count for each category.
+        jobs_data: Lightweight per-job records for the client-side Sankey.
+        out: Text stream the page is written to.
+    """
+    # html.escape quotes by default, so one escape serves attribute and text
+    category_options = "".join(
+        _OPTION_TMPL % (safe, safe)
+        for safe in (escape(str(cat)) for cat in job_categories)
+    )
+    # role_options = "".join([f'<option value="{r}">{r}</option>' for r in roles])
+    # team_options = "".join([f'<option value="{t}">{t}</option>' for t in teams])
+
+    out.write(_PAGE_HEAD)
+    out.write(
+        _PAGE_BODY_TOP_FMT(
+            total_jobs=total_jobs,
+            active_jobs=active_jobs,
+            inactive_jobs=total_jobs - active_jobs,
+            category_options=category_options,
+        )
+    )
+    out.writelines(rows_iter)
+
+    # Generate the initial HTML for the skills list (for all categories)
+    total_jobs_for_all = category_job_counts.get("All Categories", 0)
+    initial_skills_html = _generate_skills_html(
+        skills_data.get("All Categories", []), total_jobs_for_all
+    )
+    out.write(
+        _PAGE_BODY_BOTTOM_FMT(
+            initial_skills_html=initial_skills_html,
+            last_updated=last_updated,
+        )
+    )
+
+    # Convert skills_data, category_job_counts, and jobs_data to JSON for JavaScript
+    out.write(
+        _PAGE_DATA_FMT(
+            skills_data_json=_script_json(skills_data),
+            category_job_counts_json=_script_json(category_job_counts),
+            jobs_data_json=_script_json(jobs_data),
+        )
+    )
+    out.write(_PAGE_TAIL)
+
+
+def generate_dashboard_html_template(
+    total_jobs: int,
+    active_jobs: int,
+    last_updated: str,
+    table_rows: str,
+    job_categories: list,
+    roles: list,
+    teams: list,
+    skills_data: dict,
+    category_job_counts: dict,
+    jobs_data: list,
+) -> str:
+    """
+    Generates the static HTML dashboard template with dynamic data injected.
+
+    Args:
+        total_jobs: Total number of jobs.
+        active_jobs: Number of active jobs.
+        last_updated: Timestamp of the last update.
+        table_rows: HTML string containing all the <tr> table rows.
+        job_categories: A list of unique job categories for the filter dropdown.
+        roles: A list of unique roles for the filter dropdown.
+        teams: A list of unique teams for the filter dropdown.
+        skills_data: A dictionary mapping job categories to a list of their top skills.
+        category_job_counts: A dictionary with the total job count for each category.
+
+    Returns:
+        A complete HTML string for the dashboard.
+    """
+    buffer = io.StringIO()
+    stream_dashboard_html(
+        total_jobs,
+        active_jobs,
+        last_updated,
+        (table_rows,),
+        job_categories,
+        roles,
+        teams,
+        skills_data,
+        category_job_counts,
+        jobs_data,
+        buffer,
+    )
+    return buffer.getvalue()
+
+
 def _generate_skills_html(skills_list: List, total_jobs_in_category: int) -> str:
     """
     Helper function to generate the HTML for the skills list.
@@ -241,23 +330,30 @@ def _generate_skills_html(skills_list: List, total_jobs_in_category: int) -> str
     if not skills_list or total_jobs_in_category == 0:
         return "<p>No specific skills found for this category.</p>"
 
-    html = '<div class="skills-grid">'
-    for skill_item in skills_list:
-        skill, counts, total = skill_item
-        basic_percentage = (counts["basic_count"] / total_jobs_in_category) * 100
-        preferred_percentage = (
-            counts["preferred_count"] / total_jobs_in_category
-        ) * 100
-        total_percentage = basic_percentage + preferred_percentage
-        html += f"""
+    # Percentages for every skill in one vectorised pass; float64 keeps the
+    # rounding identical to the per-item Python arithmetic
+    basic = np.array([item[1]["basic_count"] for item in skills_list], dtype=float)
+    preferred = np.array(
+        [item[1]["preferred_count"] for item in skills_list], dtype=float
+    )
+    basic_pct = basic / total_jobs_in_category * 100
+    preferred_pct = preferred / total_jobs_in_category * 100
+    total_pct = basic_pct + preferred_pct
+
+    parts = ['<div class="skills-grid">']
+    for skill_item, basic_percentage, preferred_percentage, total_percentage in zip(
+        skills_list, basic_pct.tolist(), preferred_pct.tolist(), total_pct.tolist()
+    ):
+        skill = skill_item[0]
+        parts.append(f"""
             <div class="skill-item">
-                <span class="skill-name">{escape(str(skill))}</span>
+                <span class="skill-name">{escape(str(skill), quote=False)}</span>
                 <div class="skill-bar-container">
                     <div class="skill-bar-basic" style="width: {basic_percentage:.1f}%;"></div>
                     <div class="skill-bar-preferred" style="width: {preferred_percentage:.1f}%;"></div>
                 </div>
                 <span class="skill-percentage">{total_percentage:.1f}%</span>
             </div>
-        """
-    html += "</div>"
-    return html
+        """)
+    parts.append("</div>")
+    return "".join(parts)
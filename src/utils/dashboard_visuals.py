@@ -3,6 +3,7 @@ Dashboard visualization utilities
 """
 
 import plotly.graph_objects as go  # type: ignore
+import numpy as np
 import pandas as pd
 
 
@@ -50,18 +51,12 @@ def create_sankey_diagram(df: pd.DataFrame, as_html: bool = False):
         ),
     )
 
-    all_nodes = (
-        pd.Series(pd.concat([flow_data["source"], flow_data["target"]]).unique())
-        .reset_index()
-        .rename(columns={"index": "node_id", 0: "name"})
-    )
-
-    flow_data = pd.merge(
-        flow_data, all_nodes, left_on="source", right_on="name", how="left"
-    ).rename(columns={"node_id": "source_id"})
-    flow_data = pd.merge(
-        flow_data, all_nodes, left_on="target", right_on="name", how="left"
-    ).rename(columns={"node_id": "target_id"})
+    # One factorize over sources then targets numbers the nodes in order of
+    # first appearance and yields both link endpoints' ids
+    codes, names = pd.factorize(pd.concat([flow_data["source"], flow_data["target"]]))
+    all_nodes = pd.DataFrame({"node_id": np.arange(len(names)), "name": names})
+    flow_data["source_id"] = codes[: len(flow_data)]
+    flow_data["target_id"] = codes[len(flow_data) :]
 
     categories = df_active["job_category"].unique()
 
@@ -79,33 +74,24 @@ def create_sankey_diagram(df: pd.DataFrame, as_html: bool = False):
         cat: plotly_palette[i % len(plotly_palette)] for i, cat in enumerate(categories)
     }
 
-    node_color_map = {}
-    for _, row in df_active.iterrows():
-        category = row["job_category"]
-        team = row["team"]
-        role = row["role"]
-
-        if category in category_colors:
-            color = category_colors[category]
-        else:
-            color = "#CCCCCC"
-
-        node_color_map[category] = color
-        node_color_map[team] = color
-        node_color_map[role] = color
+    # Each node takes its row's category colour; walking rows in order, the
+    # last row naming a node wins (a name may appear at several levels)
+    row_colors = df_active["job_category"].map(category_colors).fillna("#CCCCCC")
+    names = df_active[["job_category", "team", "role"]].to_numpy().ravel()
+    colors = pd.Series(np.repeat(row_colors.to_numpy(), 3), index=names)
+    node_color_map = colors[~colors.index.duplicated(keep="last")].to_dict()
 
     node_colors = [node_color_map.get(name, "#CCCCCC") for name in all_nodes["name"]]
 
     # MODIFIED: Change opacity to 0.4 to match the example
     opacity = 0.4
-    link_colors = [
-        node_colors[src_id].replace("0.8", str(opacity))
-        for src_id in flow_data["source_id"]
-    ]
+    # Fade each node's colour once; links then just pick their source's
+    link_palette = [color.replace("0.8", str(opacity)) for color in node_colors]
+    link_colors = [link_palette[src_id] for src_id in flow_data["source_id"]]
 
-    category_counts = df_active.groupby("job_category").size()
-    team_counts = df_active.groupby("team").size()
-    role_counts = df_active.groupby("role").size()
+    category_counts = df_active["job_category"].value_counts(sort=False)
+    team_counts = df_active["team"].value_counts(sort=False)
+    role_counts = df_active["role"].value_counts(sort=False)
 
     # Concatenating may produce duplicate index labels (e.g., same name across levels)
     # Aggregate by index to ensure uniqueness, then map via dict to avoid reindexing issues
@@ -1,7 +1,21 @@
 import re
-from collections import defaultdict
+from typing import Dict, List
+import numpy as np
 import pandas as pd
 
+# Patterns used by _clean_and_split_quals, compiled once instead of per row
+_BOILERPLATE_MARKER = "Amazon is an equal opportunities employer"
+_BOILERPLATE_RE = re.compile(re.escape(_BOILERPLATE_MARKER) + ".*", re.DOTALL)
+_BR_RE = re.compile(r"(?i)<br\s*/?>")
+_LI_CLOSE_RE = re.compile(r"(?i)</li\s*>")
+_LI_OPEN_RE = re.compile(r"(?i)<li\s*>")
+_UL_RE = re.compile(r"(?is)<ul[^>]*>|</ul\s*>")
+_TAG_RE = re.compile(r"(?is)<[^>]+>")
+_LINE_SPLIT_RE = re.compile(r"[\r\n]+")
+_BULLET_CHARS = "-–—•*·"
+_BULLET_RE = re.compile(r"^[\-–—•*·]+\s*")
+_TRAILING_PUNCT_RE = re.compile(r"[\s\.;:,]+$")
+
 
 def _clean_and_split_quals(text: str) -> list:
     """
@@ -11,33 +25,55 @@ def _clean_and_split_quals(text: str) -> list:
     if not isinstance(text, str):
         return []
 
-    # Remove boilerplate text like 'Amazon is an equal opportunities employer...'
-    boilerplate_pattern = r"Amazon is an equal opportunities employer.*"
-    text = re.sub(boilerplate_pattern, "", text, flags=re.DOTALL)
-
-    # Normalize HTML line breaks and list markup to newlines
-    text = re.sub(r"(?i)<br\s*/?>", "\n", text)
-    text = re.sub(r"(?i)</li\s*>", "\n", text)
-    text = re.sub(r"(?i)<li\s*>", "", text)
-    text = re.sub(r"(?is)<ul[^>]*>|</ul\s*>", "", text)
-    # Strip any remaining tags conservatively
-    text = re.sub(r"(?is)<[^>]+>", " ", text)
+    # Remove boilerplate text like 'Amazon is an equal opportunities employer...';
+    # the substring check skips the regex scan on the many texts without it
+    if _BOILERPLATE_MARKER in text:
+        text = _BOILERPLATE_RE.sub("", text)
+
+    # Normalize HTML line breaks and list markup to newlines (plain text has
+    # no tags, so it skips all of these)
+    if "<" in text:
+        text = _BR_RE.sub("\n", text)
+        text = _LI_CLOSE_RE.sub("\n", text)
+        text = _LI_OPEN_RE.sub("", text)
+        text = _UL_RE.sub("", text)
+        # Strip any remaining tags conservatively
+        text = _TAG_RE.sub(" ", text)
 
     # Split into lines and clean bullet prefixes
-    raw_lines = [ln.strip() for ln in re.split(r"[\r\n]+", text) if ln.strip()]
+    raw_lines = [ln.strip() for ln in _LINE_SPLIT_RE.split(text) if ln.strip()]
     cleaned = []
     seen = set()
     for line in raw_lines:
         # Remove common bullet characters and dashes at the start
-        line = re.sub(r"^[\-–—•*·]+\s*", "", line)
+        if line[0] in _BULLET_CHARS:
+            line = _BULLET_RE.sub("", line)
         # Trim trailing punctuation noise
-        line = re.sub(r"[\s\.;:,]+$", "", line)
+        line = _TRAILING_PUNCT_RE.sub("", line)
         if line and line not in seen:
             seen.add(line)
             cleaned.append(line)
     return cleaned
 
 
+def _explode_quals(df: pd.DataFrame, column: str) -> pd.Series:
+    """One row per (row position, qualification) for a qualification column."""
+    if column not in df.columns:
+        return pd.Series([], dtype=object)
+    # Reposted jobs repeat the same qualification text, so each distinct text
+    # is parsed once and its list shared by every row that carries it
+    parsed: Dict[str, List[str]] = {}
+    split = []
+    for text in df[column].to_numpy(dtype=object):
+        text = str(text)
+        quals = parsed.get(text)
+        if quals is None:
+            quals = parsed[text] = _clean_and_split_quals(text)
+        split.append(quals)
+    split = pd.Series(split, dtype=object)
+    return split.explode().dropna()
+
+
 def get_skills_by_category(df: pd.DataFrame, job_category: str) -> list:
     """
     Extracts and counts all basic and preferred qualifications for a given job category.
@@ -52,39 +88,83 @@ def get_skills_by_category(df: pd.DataFrame, job_category: str) -> list:
               The list is sorted in descending order of total count.
     """
     # If job_category is 'ALL', use the entire DataFrame. Otherwise, filter by category.
+    # Read-only from here on, so no defensive copy of the (wide) frame
     if job_category.upper() == "ALL":
-        filtered_df = df.copy()
+        filtered_df = df
     else:
-        filtered_df = df[df["job_category"] == job_category].copy()
+        filtered_df = df[df["job_category"] == job_category]
 
     if filtered_df.empty:
         print(f"No jobs found for category: '{job_category}'.")
         return []
 
-    # Dictionary to store qualifications and their counts
-    qualifications: defaultdict = defaultdict(
-        lambda: {"basic_count": 0, "preferred_count": 0}
-    )
-
-    # Iterate through the filtered DataFrame and populate the dictionary
-    for _, row in filtered_df.iterrows():
-        # Process basic qualifications
-        basic_quals = _clean_and_split_quals(str(row.get("basic_qual", "")))
-        for qual in basic_quals:
-            qualifications[qual]["basic_count"] += 1
-
-        # Process preferred qualifications
-        pref_quals = _clean_and_split_quals(str(row.get("pref_qual", "")))
-        for qual in pref_quals:
-            qualifications[qual]["preferred_count"] += 1
-
-    # Create a list of tuples with total counts
-    sorted_quals = []
-    for qual, counts in qualifications.items():
-        total_count = counts["basic_count"] + counts["preferred_count"]
-        sorted_quals.append((qual, counts, total_count))
-
-    # Sort the list by total count in descending order
-    sorted_quals.sort(key=lambda x: x[2], reverse=True)
-
-    return sorted_quals
+    # Split each row's qualifications (one list per row), then flatten with
+    # the row position so counting happens in one vectorised pass
+    basic = _explode_quals(filtered_df, "basic_qual")
+    pref = _explode_quals(filtered_df, "pref_qual")
+    return _count_quals(basic, pref)
+
+
+def get_skills_for_all_categories(df: pd.DataFrame, job_categories: list) -> dict:
+    """
+    Counts qualifications for all jobs and for each of the given categories.
+
+    Each row's qualification text is cleaned and split once and the result is
+    shared by the "All Categories" entry and the row's own category, giving
+    the same lists as calling get_skills_by_category for each of them.
+
+    Args:
+        df (pd.DataFrame): The input DataFrame containing job listings.
+        job_categories (list): The categories to report, besides all jobs.
+
+    Returns:
+        dict: Maps "All Categories" and each category to its sorted list.
+    """
+    if df.empty:
+        print("No jobs found for category: 'ALL'.")
+        return {"All Categories": [], **{category: [] for category in job_categories}}
+
+    basic = _explode_quals(df, "basic_qual")
+    pref = _explode_quals(df, "pref_qual")
+    skills = {"All Categories": _count_quals(basic, pref)}
+
+    row_categories = df["job_category"].to_numpy(dtype=object)
+    basic_rows = basic.index.to_numpy()
+    pref_rows = pref.index.to_numpy()
+    for category in job_categories:
+        in_category = row_categories == category
+        if not in_category.any():
+            print(f"No jobs found for category: '{category}'.")
+            skills[category] = []
+            continue
+        skills[category] = _count_quals(
+            basic[in_category[basic_rows]], pref[in_category[pref_rows]]
+        )
+    return skills
+
+
+def _count_quals(basic: pd.Series, pref: pd.Series) -> list:
+    """Count exploded basic/preferred qualifications into the sorted skills list."""
+    # Order as first seen row by row (basic before preferred) so ties keep the
+    # order the dashboard has always shown
+    quals = pd.concat([basic, pref], keys=[0, 1], names=["kind", "row"])
+    quals = quals.sort_index(level="row", kind="stable", sort_remaining=False)
+    codes, uniques = pd.factorize(quals)
+    is_basic = quals.index.get_level_values("kind").to_numpy() == 0
+    basic_counts = np.bincount(codes[is_basic], minlength=len(uniques))
+    pref_counts = np.bincount(codes[~is_basic], minlength=len(uniques))
+    totals = basic_counts + pref_counts
+
+    # Sort by total count in descending order (stable for equal totals)
+    order = np.argsort(-totals, kind="stable")
+    return [
+        (
+            uniques[i],
+            {
+                "basic_count": int(basic_counts[i]),
+                "preferred_count": int(pref_counts[i]),
+            },
+            int(totals[i]),
+        )
+        for i in order
+    ]
@@ -10,6 +10,10 @@ from datetime import datetime, timedelta
 import sys
 from src.scraper.config import ScraperConfig  # type: ignore
 from src.utils.paths import get_raw_path  # type: ignore
+from src.utils.raw_storage import coerce_active, read_jobs_table  # type: ignore
+
+# Columns the data-quality checks look at
+_HEALTH_COLUMNS = frozenset({"id", "title", "job_url", "active", "posting_date"})
 
 
 def check_scraper_health():
@@ -40,7 +44,8 @@ def check_scraper_health():
 
     # Check data quality
     try:
-        df = pd.read_csv(data_file)
+        # Only the columns inspected below; the descriptions are never parsed
+        df = read_jobs_table(data_file, columns=_HEALTH_COLUMNS)
 
         if len(df) == 0:
             print("❌ Data file is empty")
@@ -48,7 +53,13 @@ def check_scraper_health():
 
         # Basic statistics
         total_jobs = len(df)
-        active_jobs = df["active"].sum() if "active" in df.columns else 0
+        if "active" in df.columns:
+            # CSV round-trips may leave strings/blanks; only explicit falsy values
+            # count as inactive (same rule as the dashboard)
+            active = coerce_active(df["active"])
+            active_jobs = int(active.to_numpy(dtype=bool).sum())
+        else:
+            active_jobs = 0
         inactive_jobs = total_jobs - active_jobs
 
         print("📊 Data Statistics:")
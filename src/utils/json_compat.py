@@ -0,0 +1,51 @@
+"""
+JSON encode/decode helpers that use orjson when it is installed.
+
+orjson parses and serializes several times faster than the standard library;
+without it these fall back to json with matching (compact, UTF-8) output.
+"""
+
+import json
+from types import ModuleType
+from typing import Any, Optional, Union
+
+orjson: Optional[ModuleType]
+try:
+    # Imported under an alias so the Optional binding below is the only
+    # definition mypy sees, with or without the extra installed
+    import orjson as _orjson
+
+    orjson = _orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False, non_str_keys: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize.
+        indent: Pretty-print with two-space indentation instead of compact output.
+        non_str_keys: Allow non-string dict keys (e.g. ints), written as strings.
+    """
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if non_str_keys:
+            option |= orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, option=option)
+    # json already stringifies int/float/bool/None keys, so non_str_keys needs
+    # no handling here
+    if indent:
+        text = json.dumps(obj, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
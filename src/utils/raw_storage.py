@@ -1,8 +1,14 @@
 """
 Unified raw storage writer using centralized path helpers.
+
+The on-disk format follows the configured raw filename's suffix: ``.parquet``
+(zstd-compressed) or ``.feather`` need pyarrow (``pip install '.[parquet]'``);
+anything else is written as CSV.
 """
 
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import Collection, List, Dict, Optional
+import numpy as np
 import pandas as pd
 
 from src.scraper.config import ScraperConfig  # type: ignore
@@ -24,6 +30,68 @@ REQUIRED_COLUMNS = [
     "source",
 ]
 
+# 'active' values (after str/strip/lower) that mark a job inactive; anything
+# else, including NaN/empty, counts as active (currently scraped jobs)
+FALSY_ACTIVE = frozenset({"false", "f", "0", "no", "n"})
+
+
+def coerce_active(values: pd.Series) -> pd.Series:
+    """Coerce an 'active' column to bool; only explicit falsy values are False."""
+    if values.dtype == bool:
+        return values
+    # Normalize each distinct value once rather than every row; missing values
+    # get code -1, which picks the trailing True
+    codes, uniques = pd.factorize(values)
+    lookup = np.array(
+        [str(value).strip().lower() not in FALSY_ACTIVE for value in uniques] + [True],
+        dtype=bool,
+    )
+    return pd.Series(lookup[codes], index=values.index, name=values.name)
+
+
+def read_jobs_table(
+    path: Path, columns: Optional[Collection[str]] = None, **csv_kwargs
+) -> pd.DataFrame:
+    """Read a jobs table, picking the reader from the file suffix.
+
+    Args:
+        path: File to read (.parquet, .feather, else CSV)
+        columns: If given, load only these columns; names missing from the
+            file are ignored
+        csv_kwargs: Passed to ``pd.read_csv`` only; columnar formats keep the
+            dtypes they were written with
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".parquet":
+        if columns is None:
+            return pd.read_parquet(path)
+        from pyarrow import parquet  # type: ignore
+
+        names = parquet.read_schema(path).names
+        return pd.read_parquet(path, columns=[c for c in names if c in columns])
+    if suffix == ".feather":
+        df = pd.read_feather(path)
+        return df if columns is None else df[[c for c in df.columns if c in columns]]
+    if columns is not None:
+        if csv_kwargs.get("engine") == "pyarrow":
+            # The pyarrow engine only takes usecols as a list of existing names
+            header = pd.read_csv(path, nrows=0).columns
+            csv_kwargs["usecols"] = [c for c in header if c in columns]
+        else:
+            csv_kwargs["usecols"] = lambda name: name in columns
+    return pd.read_csv(path, **csv_kwargs)
+
+
+def write_jobs_table(df: pd.DataFrame, path: Path) -> None:
+    """Write a jobs table, picking the writer from the file suffix."""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".parquet":
+        df.to_parquet(path, compression="zstd", index=False)
+    elif suffix == ".feather":
+        df.reset_index(drop=True).to_feather(path)
+    else:
+        df.to_csv(path, index=False)
+
 
 def _normalize_records(records: List[Dict]) -> List[Dict]:
     norm = []
@@ -71,14 +139,14 @@ def save_raw_jobs(
     # Append/dedupe with existing file
     if path.exists():
         try:
-            existing = pd.read_csv(path, dtype={"id": str})
+            existing = read_jobs_table(path, dtype={"id": str})
         except Exception:
             existing = pd.DataFrame(columns=df.columns)
         combined = pd.concat([existing, df], ignore_index=True)
         if "id" in combined.columns:
             combined.drop_duplicates(subset=["id"], keep="last", inplace=True)
-        combined.to_csv(path, index=False)
+        write_jobs_table(combined, path)
     else:
-        df.to_csv(path, index=False)
+        write_jobs_table(df, path)
 
     return path
@@ -1,22 +1,28 @@
 import json
 import os
 from datetime import datetime
-from typing import Set, Optional
+from typing import Iterable, List, Set, Optional
+
+from src.utils.json_compat import json_dumps  # type: ignore
+
+DEFAULT_STATE_FILE = "theirstack_state.json"
 
 
 class TheirStackState:
-    def __init__(self, state_file: str = "theirstack_state.json"):
+    def __init__(self, state_file: str = DEFAULT_STATE_FILE):
         self.state_file = state_file
         # Initialize attributes with types once
         self.last_run_date: Optional[str] = None
         self.scraped_job_ids: Set[str] = set()
+        # Same IDs in insertion order (oldest first), used to pick recent exclusions
+        self._id_order: List[str] = []
         if os.path.exists(self.state_file):
             with open(self.state_file, "r") as f:
                 state = json.load(f)
                 self.last_run_date = state.get("last_run_date", None)
                 # Normalize all IDs to strings
                 loaded_ids = state.get("scraped_job_ids", [])
-                self.scraped_job_ids = set(str(x) for x in loaded_ids)
+                self._set_ids(str(x) for x in loaded_ids)
         else:
             # Keep defaults when no state file exists
             self.last_run_date = None
@@ -29,10 +35,16 @@ class TheirStackState:
                 state = json.load(f)
                 self.last_run_date = state.get("last_run_date", None)
                 loaded_ids = state.get("scraped_job_ids", [])
-                self.scraped_job_ids = set(str(x) for x in loaded_ids)
+                self._set_ids(str(x) for x in loaded_ids)
         else:
             self.last_run_date = None
             self.scraped_job_ids = set()
+            self._id_order = []
+
+    def _set_ids(self, ids):
+        """Replace tracked IDs, keeping first-seen order and dropping duplicates"""
+        self._id_order = list(dict.fromkeys(ids))
+        self.scraped_job_ids = set(self._id_order)
 
     def save(self):
         """Save current state to file"""
@@ -40,22 +52,22 @@ class TheirStackState:
             json.dump(
                 {
                     "last_run_date": self.last_run_date,
-                    "scraped_job_ids": list(self.scraped_job_ids),
+                    "scraped_job_ids": self._id_order,
                 },
                 f,
             )
 
     def save_state(self):
         """Save current state to file"""
-        with open(self.state_file, "w") as f:
-            json.dump(
-                {
-                    "last_run_date": self.last_run_date,
-                    "scraped_job_ids": list(self.scraped_job_ids),
-                },
-                f,
-                indent=2,
-            )
+        state = {
+            "last_run_date": self.last_run_date,
+            "scraped_job_ids": self._id_order,
+        }
+        # Encode up front and write once; json.dump with indent streams many
+        # tiny chunks from the pure-Python encoder into the file
+        data = json_dumps(state, indent=True)
+        with open(self.state_file, "wb") as f:
+            f.write(data)
 
     def update_last_run(self):
         """Update last run date to current time"""
@@ -63,12 +75,39 @@ class TheirStackState:
 
     def add_job_id(self, job_id: str):
         """Add a job ID to tracked list"""
-        self.scraped_job_ids.add(job_id)
+        if job_id not in self.scraped_job_ids:
+            self.scraped_job_ids.add(job_id)
+            self._id_order.append(job_id)
+
+    def add_job_ids(self, job_ids: Iterable[str]):
+        """Add several job IDs to tracked list in one pass (not saved until save_state)"""
+        new_ids = [
+            job_id
+            for job_id in dict.fromkeys(job_ids)
+            if job_id not in self.scraped_job_ids
+        ]
+        self.scraped_job_ids.update(new_ids)
+        self._id_order.extend(new_ids)
+
+    def recent_job_ids(self, limit: int = 0) -> List[str]:
+        """Return tracked IDs, oldest first, keeping only the newest `limit` (0 = all)"""
+        if limit and len(self._id_order) > limit:
+            return self._id_order[-limit:]
+        return list(self._id_order)
 
     def is_job_new(self, job_id: str) -> bool:
         """Check if job ID has been seen before"""
         return job_id not in self.scraped_job_ids
 
+    @staticmethod
+    def modified_date(state_file: str = DEFAULT_STATE_FILE) -> Optional[str]:
+        """Return the state file's modification date (YYYY-MM-DD) without parsing it"""
+        try:
+            mtime = os.path.getmtime(state_file)
+        except OSError:
+            return None
+        return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
+
     def get_last_run_date(self) -> Optional[str]:
         """Return last run date (YYYY-MM-DD) or None if never run"""
         return self.last_run_date
@@ -0,0 +1,59 @@
+"""Tests for reading source files in src.utils.combine_jobs."""
+
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.utils import combine_jobs
+from src.utils.raw_storage import write_jobs_table
+
+pytest.importorskip("pyarrow")
+
+
+def _write_multiline_source(path: Path, rows: int) -> None:
+    """A raw source CSV with quoted multi-line descriptions and qualifications."""
+    rng = random.Random(0)
+    words = ["python", "sql", "aws", "spark", "data", "models", "teams", "ship"]
+
+    def paragraph(lines: int) -> str:
+        return "\n".join(
+            "- " + " ".join(rng.choice(words) for _ in range(12)) for _ in range(lines)
+        )
+
+    pd.DataFrame(
+        {
+            "id": range(rows),
+            "title": [f"Engineer, {i}" for i in range(rows)],
+            "company": "Amazon",
+            "posting_date": [
+                rng.choice(
+                    ["August 12, 2025", "2025-08-13", "2025-08-13T10:00:00Z", ""]
+                )
+                for _ in range(rows)
+            ],
+            "url": "https://example.com/job",
+            "description": [paragraph(8) for _ in range(rows)],
+            "basic_qual": [paragraph(4) for _ in range(rows)],
+            "pref_qual": [paragraph(3) for _ in range(rows)],
+            "active": [rng.choice(["True", "False", ""]) for _ in range(rows)],
+            "job_category": "Software Development",
+        }
+    ).to_csv(path, index=False)
+
+
+def test_arrow_read_matches_c_engine_on_large_multiline_file(tmp_path, monkeypatch):
+    source = tmp_path / "amazon_jobs.csv"
+    # Well beyond one Arrow read block (about 1 MB)
+    _write_multiline_source(source, rows=4000)
+    assert source.stat().st_size > 4 * 1024 * 1024
+
+    arrow_df = combine_jobs._load_job_file(source)
+    monkeypatch.setattr(combine_jobs, "pa_csv", None)
+    c_df = combine_jobs._load_job_file(source)
+
+    assert arrow_df is not None and c_df is not None
+    write_jobs_table(arrow_df, tmp_path / "arrow.csv")
+    write_jobs_table(c_df, tmp_path / "c.csv")
+    assert (tmp_path / "arrow.csv").read_bytes() == (tmp_path / "c.csv").read_bytes()